@@ -26,6 +26,7 @@
 import bpy
 import os
 import json
+import numpy as np
 
 from bpy_extras.io_utils import ImportHelper, ExportHelper
 
@@ -91,6 +92,26 @@ class PTDBLNPOPM_OT_facerange_react(bpy.types.Operator):
         return {"FINISHED"}
 
 
+class PTDBLNPOPM_OT_facerange_update(bpy.types.Operator):
+    bl_label = "Range Update"
+    bl_idname = "ptdblnpopm.facerange_update"
+    bl_description = "face range update"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    def execute(self, context):
+        scene = context.scene
+        pool = scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            ModPOPM.range_update(scene)
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"facerange_update: {my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        return {"FINISHED"}
+
+
 class PTDBLNPOPM_OT_pop_reset(bpy.types.Operator):
     bl_label = "Update Settings"
     bl_idname = "ptdblnpopm.pop_reset"
@@ -118,7 +139,7 @@ class PTDBLNPOPM_OT_pop_reset(bpy.types.Operator):
         pool = scene.ptdblnpopm_pool
         pool.update_ok = False
         try:
-            trash = pool.trax_idx >= 0
+            trash = ModFNOP.aniact_trash(pool.trax)
             pool.trax.clear()
             pool.trax_idx = -1
             pool.animorph = False
@@ -128,8 +149,9 @@ class PTDBLNPOPM_OT_pop_reset(bpy.types.Operator):
                     me.animation_data_clear()
                 if trash:
                     print("---- popmesh pop_reset: delete trash")
-                    bpy.ops.outliner.orphans_purge(do_recursive=True)
+                    ModFNOP.aniact_free(trash)
             else:
+                ModPOPM.gen_store(pool)
                 pool.pop_mesh = ModFNOP.get_new_mesh(scene)
             if self.newdef:
                 pool.props_unset()
@@ -535,6 +557,97 @@ class PTDBLNPOPM_OT_pop_noiz(bpy.types.Operator):
         row.prop(self, "vfac", text="")
 
 
+class PTDBLNPOPM_OT_pop_population(bpy.types.Operator):
+    bl_label = "Population"
+    bl_idname = "ptdblnpopm.pop_population"
+    bl_description = "new collection of noise variants (seed and amplitude)"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    count: bpy.props.IntProperty(
+        name="count", description="number of variants", default=10, min=1, max=1000
+    )
+    nseed: bpy.props.IntProperty(
+        name="seed", description="random seed", default=0, min=0
+    )
+    amp_min: bpy.props.FloatProperty(
+        name="min", description="minimum noise amplitude", default=0, min=0
+    )
+    amp_max: bpy.props.FloatProperty(
+        name="max", description="maximum noise amplitude", default=0, min=0
+    )
+    spacing: bpy.props.FloatProperty(
+        name="spacing", description="x-axis offset between variants", default=0
+    )
+
+    @classmethod
+    def poll(cls, context):
+        pool = context.scene.ptdblnpopm_pool
+        return pool.pop_mesh is not None and not pool.animorph
+
+    def invoke(self, context, event):
+        noiz = context.scene.ptdblnpopm_pool.noiz
+        self.nseed = noiz.nseed
+        self.amp_min = noiz.ampli
+        self.amp_max = noiz.ampli
+        return self.execute(context)
+
+    def execute(self, context):
+        scene = context.scene
+        pool = scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            amps = (self.amp_min, max(self.amp_min, self.amp_max))
+            ModPOPM.pop_population(scene, self.count, self.nseed, amps, self.spacing)
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"pop_population: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        return {"FINISHED"}
+
+
+class PTDBLNPOPM_OT_lod_chain(bpy.types.Operator):
+    bl_label = "LOD Chain"
+    bl_idname = "ptdblnpopm.lod_chain"
+    bl_description = "new (or updated) mesh objects at decreasing resolutions"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    levels: bpy.props.IntProperty(
+        name="levels",
+        description="number of levels (LOD0 is full resolution)",
+        default=3,
+        min=2,
+        max=8,
+    )
+    ratio: bpy.props.FloatProperty(
+        name="ratio",
+        description="resolution scale between levels",
+        default=0.5,
+        min=0.1,
+        max=0.9,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        pool = context.scene.ptdblnpopm_pool
+        return pool.pop_mesh is not None and not pool.animorph
+
+    def execute(self, context):
+        scene = context.scene
+        pool = scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            ModPOPM.lod_chain(scene, self.levels, self.ratio)
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"lod_chain: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        return {"FINISHED"}
+
+
 # ---- PATHLOC/PROFLOC COLLECTIONS OPERATORS
 
 
@@ -1009,11 +1122,13 @@ class PTDBLNPOPM_OT_read_setts(bpy.types.Operator, ImportHelper):
                 raise Exception("invalid file path")
             with open(fpath, mode="r") as f:
                 data = json.load(f)
-            trash = pool.trax_idx >= 0
+            trash = ModFNOP.aniact_trash(pool.trax)
             pool.trax.clear()
             pool.trax_idx = -1
             pool.animorph = False
             replace_mesh = pool.replace_mesh
+            if not replace_mesh:
+                ModPOPM.gen_store(pool)
             pool.props_unset()
             ModFNOP.json_to_setts(data, pool)
             if pool.pop_mesh and replace_mesh:
@@ -1022,7 +1137,7 @@ class PTDBLNPOPM_OT_read_setts(bpy.types.Operator, ImportHelper):
                     me.animation_data_clear()
                 if trash:
                     print("---- popmesh read_setts: delete trash")
-                    bpy.ops.outliner.orphans_purge(do_recursive=True)
+                    ModFNOP.aniact_free(trash)
             else:
                 pool.pop_mesh = ModFNOP.get_new_mesh(scene)
             pool.pop_mesh.show_wire = pool.show_wire
@@ -1044,6 +1159,87 @@ class PTDBLNPOPM_OT_read_setts(bpy.types.Operator, ImportHelper):
             row.label(text="WARNING! This will discard all changes")
 
 
+# ---- GENERATOR OPERATORS
+
+
+class PTDBLNPOPM_OT_gen_adopt(bpy.types.Operator):
+    bl_label = "Edit Generator"
+    bl_idname = "ptdblnpopm.gen_adopt"
+    bl_description = "load active generator object settings for editing"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        ob = context.active_object
+        return ob is not None and ModPOPM.gen_owner(ob)
+
+    def execute(self, context):
+        scene = context.scene
+        pool = scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            ModPOPM.gen_adopt(scene, context.active_object)
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"gen_adopt: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        return {"FINISHED"}
+
+
+class PTDBLNPOPM_OT_gen_assign(bpy.types.Operator):
+    bl_label = "Assign Settings"
+    bl_idname = "ptdblnpopm.gen_assign"
+    bl_description = "copy current settings to selected generators (marked dirty)"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    def execute(self, context):
+        scene = context.scene
+        pool = scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            num = ModPOPM.gen_assign(scene, context.selected_objects)
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"gen_assign: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        self.report({"INFO"}, f"assigned {num} generators")
+        return {"FINISHED"}
+
+
+class PTDBLNPOPM_OT_gen_update_all(bpy.types.Operator):
+    bl_label = "Update Generators"
+    bl_idname = "ptdblnpopm.gen_update_all"
+    bl_description = "evaluate scene generators"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    dirty_only: bpy.props.BoolProperty(default=True, options={"HIDDEN"})
+
+    @classmethod
+    def description(cls, context, properties):
+        if getattr(properties, "dirty_only"):
+            return "evaluate generators with pending changes"
+        return "evaluate all scene generators"
+
+    def execute(self, context):
+        scene = context.scene
+        pool = scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            num = ModPOPM.gen_update_all(scene, dirty_only=self.dirty_only)
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"gen_update_all: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        self.report({"INFO"}, f"updated {num} generators")
+        return {"FINISHED"}
+
+
 # ---- ANIMATION OPERATORS
 
 
@@ -1077,11 +1273,13 @@ class PTDBLNPOPM_OT_animorph_setup(bpy.types.Operator):
                 me.animation_data_clear()
             if pool.trax:
                 print("---- popmesh animode: delete trash")
-                bpy.ops.outliner.orphans_purge(do_recursive=True)
+                ModFNOP.aniact_free(ModFNOP.aniact_trash(pool.trax))
             pool.trax.clear()
             pool.trax_idx = -1
             if self.exiting:
                 pool.animorph = False
+                pool.ani_live = False
+                pool.ani_stored = False
             else:
                 me.animation_data_create()
                 pool.animorph = True
@@ -1582,6 +1780,7 @@ class PTDBLNPOPM_OT_track_remove(bpy.types.Operator):
         try:
             me = pool.pop_mesh.data
             if self.doall:
+                trash = ModFNOP.aniact_trash(pool.trax)
                 nt = [t for t in me.animation_data.nla_tracks]
                 for t in nt:
                     me.animation_data.nla_tracks.remove(t)
@@ -1590,13 +1789,14 @@ class PTDBLNPOPM_OT_track_remove(bpy.types.Operator):
             else:
                 idx = pool.trax_idx
                 item = pool.trax[idx]
+                trash = ModFNOP.aniact_trash([item])
                 t = me.animation_data.nla_tracks.get(item.t_name)
                 if t:
                     me.animation_data.nla_tracks.remove(t)
                 pool.trax.remove(idx)
                 pool.trax_idx = min(max(0, idx - 1), len(pool.trax) - 1)
             print("---- popmesh track_remove: delete trash")
-            bpy.ops.outliner.orphans_purge(do_recursive=True)
+            ModFNOP.aniact_free(trash)
         except Exception as my_err:
             pool.update_ok = True
             print(f"track_remove: {my_err.args}")
@@ -1609,7 +1809,7 @@ class PTDBLNPOPM_OT_track_remove(bpy.types.Operator):
 class PTDBLNPOPM_OT_track_copy(bpy.types.Operator):
     bl_label = "Copy"
     bl_idname = "ptdblnpopm.track_copy"
-    bl_description = "new track - copy from active"
+    bl_description = "new track - share the active track action"
     bl_options = {"REGISTER", "INTERNAL", "UNDO"}
 
     def execute(self, context):
@@ -1618,21 +1818,21 @@ class PTDBLNPOPM_OT_track_copy(bpy.types.Operator):
         ob = pool.pop_mesh
         try:
             target = pool.trax[pool.trax_idx]
-            actest = bpy.data.actions.get(target.t_name)
-            if not actest:
+            action = bpy.data.actions.get(target.action_name())
+            if not action:
                 raise Exception("null action reference!")
-            action = actest.copy()
-            name = action.name
             d = target.to_dct()
             source = pool.trax.add()
             for key in d.keys():
                 setattr(source, key, d[key])
             source.name = f"{source.name}_copy"
-            source.t_name = name
+            source.a_name = action.name
             time_warp = source.st_warp
             blauto = source.s_blauto
             track = ob.data.animation_data.nla_tracks.new()
-            track.name = name
+            track.name = f"{target.t_name}_copy"
+            name = track.name
+            source.t_name = name
             track.mute = not source.active
             start = int(action.frame_range[0])
             strip = track.strips.new(name, start, action)
@@ -1683,6 +1883,90 @@ class PTDBLNPOPM_OT_track_copy(bpy.types.Operator):
         return {"FINISHED"}
 
 
+class PTDBLNPOPM_OT_track_unshare(bpy.types.Operator):
+    bl_label = "Single"
+    bl_idname = "ptdblnpopm.track_unshare"
+    bl_description = "give the active track its own copy of a shared action"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        pool = context.scene.ptdblnpopm_pool
+        if not (0 <= pool.trax_idx < len(pool.trax)):
+            return False
+        name = pool.trax[pool.trax_idx].action_name()
+        return sum(1 for t in pool.trax if t.action_name() == name) > 1
+
+    def execute(self, context):
+        pool = context.scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            item = pool.trax[pool.trax_idx]
+            action = bpy.data.actions.get(item.action_name())
+            if not action:
+                raise Exception("null action reference!")
+            track = pool.pop_mesh.data.animation_data.nla_tracks[item.t_name]
+            action = ModFNOP.aniact_copy(action)
+            track.strips[0].action = action
+            item.a_name = action.name
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"track_unshare: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        return {"FINISHED"}
+
+
+class PTDBLNPOPM_OT_track_flatten(bpy.types.Operator):
+    bl_label = "Flatten"
+    bl_idname = "ptdblnpopm.track_flatten"
+    bl_description = (
+        "new track - bake the enabled tracks into a single action "
+        "(evaluated frame by frame: slow on long ranges)"
+    )
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    mute: bpy.props.BoolProperty(
+        name="mute sources", description="disable the baked tracks", default=True
+    )
+
+    @classmethod
+    def poll(cls, context):
+        pool = context.scene.ptdblnpopm_pool
+        return any(t.active for t in pool.trax)
+
+    def execute(self, context):
+        scene = context.scene
+        pool = scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            popme = pool.pop_mesh.data
+            kloc, fls = ModPOPM.nla_flatten(scene)
+            vals = kloc.reshape(len(fls), -1).T
+            keep = None
+            if pool.ani_kf_decim:
+                keep = ModFNOP.aniact_decimate(
+                    vals.astype(np.float64), fls, 1, pool.ani_kf_tol
+                )
+            action = ModFNOP.aniact_new(f"{pool.act_name}_flat")
+            ModFNOP.aniact_write(action, vals, fls, 1, keep)
+            if self.mute:
+                tracks = popme.animation_data.nla_tracks
+                for item in pool.trax:
+                    item.active = False
+                    tracks[item.t_name].mute = True
+            ModFNOP.aniact_nla_track_add(popme, action)
+            ModFNOP.aniact_trax_add(pool, action, fls[0], fls[-1])
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"track_flatten: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        return {"FINISHED"}
+
+
 class PTDBLNPOPM_OT_anim_action(bpy.types.Operator):
     bl_label = "Animation"
     bl_idname = "ptdblnpopm.anim_action"
@@ -1698,6 +1982,8 @@ class PTDBLNPOPM_OT_anim_action(bpy.types.Operator):
         try:
             if not pool.pop_anim_state_eval():
                 raise Exception("no animation values!")
+            if pool.pop_mesh.data.get(ModPOPM.stale_tag):
+                raise Exception("mesh is not up to date, update it first!")
         except Exception as my_err:
             pool.update_ok = True
             print(f"anim_action (acteval): {my_err.args}")
@@ -1709,107 +1995,29 @@ class PTDBLNPOPM_OT_anim_action(bpy.types.Operator):
         loop = pool.ani_kf_loop
         path = pool.path
         prof = pool.prof
-        meshrot = pool.meshrot
-        pathrot = pool.pathrot
-        profrot = pool.profrot
         noiz = pool.noiz
 
-        # ----------------- interpolation Lists ------------------#
-
-        try:
-            path_flag = path.anim_state()
-            if path_flag:
-                path_d = ModFNOP.aniact_path_edit_dict(path, loop)
-            prof_flag = prof.anim_state()
-            if prof_flag:
-                prof_d = ModFNOP.aniact_prof_edit_dict(prof, loop)
-            meshrot_play = meshrot.active and meshrot.anim_state()
-            if meshrot_play:
-                meshrot_angs = ModFNOP.aniact_rotation_list(meshrot.ani_rot, loop)
-            pathrot_play = pathrot.active and pathrot.anim_state()
-            if pathrot_play:
-                pathrot_angs = ModFNOP.aniact_rotation_list(pathrot.ani_rot, loop)
-            profrot_play = profrot.active and profrot.anim_state()
-            if profrot_play:
-                profrot_angs = ModFNOP.aniact_rotation_list(profrot.ani_rot, loop)
-            pathloc_d = ModFNOP.aniact_edvals_dict(pool.pathloc, loop, twodim=False)
-            blnd_d = ModFNOP.aniact_blendvals_dict(pool.blnd, loop)
-            profloc_d = ModFNOP.aniact_edvals_dict(pool.profloc, loop, twodim=True)
-            if noiz.active:
-                nsd = None if (noiz.anim_state() and noiz.ani_seed) else noiz.nseed
-                noiz_d = {"seed": nsd, "ampli": ModFNOP.aniact_noiz_list(noiz, loop)}
-        except Exception as my_err:
-            pool.update_ok = True
-            print(f"anim_action (lrplst): {my_err.args}")
-            self.report({"INFO"}, f"{my_err.args}")
-            return {"CANCELLED"}
-
         # --------------- animation loop updates -----------------#
 
-        sindz = pool.rngs.sindz_get()
-        sindz_on = pool.rngs.active
-        nlocs = path.pathed.npts * prof.profed.npts
+        nact = path.pathed.npts * prof.profed.npts
+        if pool.rngs.sindz_on():
+            nact = len(pool.rngs.sindz_get())
+        kloc = None
+        fcache = ModPOPM.pop_disk_cache(pool) if pool.cache_frames else None
+        if noiz.active and noiz.anim_state() and noiz.ani_seed:
+            fcache = None
         try:
-            pop = ModPOPM.new_pop_instance(pool)
-            if meshrot.active:
-                pop.mesh_rotate(meshrot.axis, meshrot.angle, meshrot.pivot)
-            if pathrot.active:
-                pop.path_rotate(
-                    pathrot.axis,
-                    pathrot.angle,
-                    pathrot.pivot,
-                    pathrot.piv_object,
-                    pathrot.batt,
-                )
-            if profrot.active:
-                pop.prof_rotate(profrot.roll)
-            kloc = []
-            for i in range(loop):
-                pop.reset_edlocs()
-                if path_flag:
-                    pop.path_anim_update(*(v[i] for v in path_d.values()))
-                if prof_flag:
-                    pop.prof_anim_update(*(v[i] for v in prof_d.values()))
-                for dct, nids, ams in zip(
-                    pathloc_d["dcts"], pathloc_d["nids"], pathloc_d["ams"]
-                ):
-                    dct["nprams"]["idx"] = nids[i]
-                    dct["fac"] = ams[i]
-                    pop.path_locations(dct)
-                for dct, nids, ams, ids in zip(
-                    blnd_d["dcts"],
-                    blnd_d["nids"],
-                    blnd_d["ams"],
-                    blnd_d["ids"],
-                ):
-                    dct["nprams"]["idx"] = nids[i]
-                    dct["fac"] = ams[i]
-                    dct["iprams"]["idx"] = ids[i]
-                    pop.prof_blend(dct)
-                for dct, nids, ams, ids in zip(
-                    profloc_d["dcts"],
-                    profloc_d["nids"],
-                    profloc_d["ams"],
-                    profloc_d["ids"],
-                ):
-                    dct["nprams"]["idx"] = nids[i]
-                    dct["fac"] = ams[i]
-                    dct["iprams"]["idx"] = ids[i]
-                    pop.prof_locations(dct)
-                if meshrot_play:
-                    pop.meshrot_anim_angle(meshrot_angs[i])
-                if pathrot_play:
-                    pop.pathrot_anim_angle(pathrot_angs[i])
-                if profrot_play:
-                    pop.roll_anim_angle(profrot_angs[i])
-                locs = pop.get_locs()
-                if noiz.active:
-                    locs = ModPOPM.noiz_locs(
-                        locs, noiz.vfac, noiz_d["ampli"][i], noiz_d["seed"]
-                    )
-                if sindz_on:
-                    locs = [locs[j] for j in range(nlocs) if j in sindz]
-                kloc.append(locs)
+            if fcache:
+                fkey = ModPOPM.pop_frames_key(pool)
+                entry = fcache.get(fkey)
+                if entry:
+                    kloc = entry[1]["frames"]
+            if kloc is None:
+                kloc = np.empty((loop, nact, 3), dtype=np.float32)
+                for i, locs in ModPOPM.anim_frames(pool):
+                    kloc[i] = locs
+                if fcache:
+                    fcache.put(fkey, {"frames": kloc}, {})
         except Exception as my_err:
             pool.update_ok = True
             print(f"anim_action (animloop): {my_err.args}")
@@ -1822,32 +2030,22 @@ class PTDBLNPOPM_OT_anim_action(bpy.types.Operator):
         k_beg = pool.ani_kf_start
         k_stp = pool.ani_kf_step
         ki_type = int(pool.ani_kf_type)
-        kls = [ki_type] * loop
         fls = [k_beg + i * k_stp for i in range(loop)]
         try:
             popme = pool.pop_mesh.data
-            active_locs = len(popme.vertices)
-            trk = pool.trax.add()
-            action = bpy.data.actions.new(a_name)
-            funcname = "aniact_fc_create_bez" if ki_type == 2 else "aniact_fc_create"
-            fc_create = getattr(ModFNOP, funcname)
-            for p in range(active_locs):
-                dp = f"vertices[{p}].co"
-                for di in range(3):
-                    vls = [kloc[k][p][di] for k in range(loop)]
-                    fc_create(action, dp, di, fls, vls, kls, loop)
+            if kloc.shape[1] != len(popme.vertices):
+                raise Exception("mesh vertices do not match the animation!")
+            vals = kloc.reshape(loop, -1).T
+            action = ModFNOP.aniact_new(a_name)
+            keep = None
+            if pool.ani_kf_decim:
+                tol = pool.ani_kf_tol
+                keep = ModFNOP.aniact_decimate(
+                    vals.astype(np.float64), fls, ki_type, tol
+                )
+            ModFNOP.aniact_write(action, vals, fls, ki_type, keep)
             ModFNOP.aniact_nla_track_add(popme, action)
-            trk.t_name = action.name
-            k_end = fls[-1]
-            trk.ac_beg = k_beg
-            trk.ac_end = k_end
-            trk.sa_beg = k_beg
-            trk.sa_end = k_end
-            trk.s_beg = k_beg
-            trk.s_end = k_end
-            idx = len(pool.trax) - 1
-            pool.trax.move(idx, 0)
-            pool.trax_idx = 0
+            ModFNOP.aniact_trax_add(pool, action, k_beg, fls[-1])
         except Exception as my_err:
             pool.update_ok = True
             print(f"anim_action (actnla): {my_err.args}")
@@ -1857,6 +2055,103 @@ class PTDBLNPOPM_OT_anim_action(bpy.types.Operator):
         return {"FINISHED"}
 
 
+class PTDBLNPOPM_OT_anim_vat(bpy.types.Operator, ExportHelper):
+    bl_label = "Export VAT"
+    bl_idname = "ptdblnpopm.anim_vat"
+    bl_description = "export animation frames as vertex animation textures"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    filename_ext = ""
+    check_extension = None
+
+    vat_format: bpy.props.EnumProperty(
+        name="format",
+        description="texture file format",
+        items=(
+            ("EXR", "exr", "float image (rgb: xyz)"),
+            ("NPY", "npy", "raw numpy array (frames, verts, 3)"),
+        ),
+        default="EXR",
+    )
+    normals: bpy.props.BoolProperty(
+        name="normals", description="also export vertex normals", default=False
+    )
+
+    def invoke(self, context, event):
+        self.filepath = "popmesh_vat"
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        pool = context.scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            if not pool.pop_anim_state_eval():
+                raise Exception("no animation values!")
+            fpath = self.filepath
+            if os.path.dirname(fpath):
+                os.makedirs(os.path.dirname(fpath), exist_ok=True)
+            ModPOPM.anim_vat_export(pool, fpath, self.vat_format, self.normals)
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"anim_vat: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        return {"FINISHED"}
+
+
+class PTDBLNPOPM_OT_anim_store(bpy.types.Operator, ExportHelper):
+    bl_label = "Store Frames"
+    bl_idname = "ptdblnpopm.anim_store"
+    bl_description = "bake animation frames to a delta compressed file for playback"
+    bl_options = {"REGISTER", "INTERNAL", "UNDO"}
+
+    filename_ext = ".npz"
+
+    quant: bpy.props.FloatProperty(
+        name="quantize",
+        description="delta quantization step (maximum error: half a step)",
+        default=0.0001,
+        min=0.000001,
+        precision=6,
+        step=0.001,
+    )
+    interval: bpy.props.IntProperty(
+        name="keyframes",
+        description="store a full frame every n frames (random access)",
+        default=30,
+        min=1,
+    )
+
+    def invoke(self, context, event):
+        self.filepath = "popmesh_frames.npz"
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        scene = context.scene
+        pool = scene.ptdblnpopm_pool
+        pool.update_ok = False
+        try:
+            if not pool.pop_anim_state_eval():
+                raise Exception("no animation values!")
+            fpath = self.filepath
+            if os.path.dirname(fpath):
+                os.makedirs(os.path.dirname(fpath), exist_ok=True)
+            ModPOPM.anim_store_bake(pool, fpath, self.quant, self.interval)
+            pool.ani_store = fpath
+            pool.ani_stored = True
+            ModPOPM.store_update(scene)
+        except Exception as my_err:
+            pool.update_ok = True
+            print(f"anim_store: {my_err.args}")
+            self.report({"INFO"}, f"{my_err.args}")
+            return {"CANCELLED"}
+        pool.update_ok = True
+        return {"FINISHED"}
+
+
 # ------------------------------------------------------------------------------
 #
 # --------------------------- REGISTRATION -------------------------------------
@@ -1865,6 +2160,7 @@ class PTDBLNPOPM_OT_anim_action(bpy.types.Operator):
 classes = (
     PTDBLNPOPM_OT_pop_simple_update,
     PTDBLNPOPM_OT_facerange_react,
+    PTDBLNPOPM_OT_facerange_update,
     PTDBLNPOPM_OT_pop_reset,
     PTDBLNPOPM_OT_setup_provider,
     PTDBLNPOPM_OT_update_preset,
@@ -1873,6 +2169,8 @@ classes = (
     PTDBLNPOPM_OT_profrot_edit,
     PTDBLNPOPM_OT_meshrot_edit,
     PTDBLNPOPM_OT_pop_noiz,
+    PTDBLNPOPM_OT_pop_population,
+    PTDBLNPOPM_OT_lod_chain,
     PTDBLNPOPM_OT_citem_add,
     PTDBLNPOPM_OT_citem_copy,
     PTDBLNPOPM_OT_citem_enable,
@@ -1885,6 +2183,9 @@ classes = (
     PTDBLNPOPM_OT_blnd_move,
     PTDBLNPOPM_OT_write_setts,
     PTDBLNPOPM_OT_read_setts,
+    PTDBLNPOPM_OT_gen_adopt,
+    PTDBLNPOPM_OT_gen_assign,
+    PTDBLNPOPM_OT_gen_update_all,
     PTDBLNPOPM_OT_animorph_setup,
     PTDBLNPOPM_OT_anicycmirend,
     PTDBLNPOPM_OT_anicalc,
@@ -1892,7 +2193,11 @@ classes = (
     PTDBLNPOPM_OT_track_enable,
     PTDBLNPOPM_OT_track_remove,
     PTDBLNPOPM_OT_track_copy,
+    PTDBLNPOPM_OT_track_unshare,
+    PTDBLNPOPM_OT_track_flatten,
     PTDBLNPOPM_OT_anim_action,
+    PTDBLNPOPM_OT_anim_vat,
+    PTDBLNPOPM_OT_anim_store,
 )
 
 
@@ -1901,10 +2206,28 @@ def register():
 
     for cls in classes:
         register_class(cls)
+    bpy.app.handlers.undo_post.append(ModPOPM.lod_undo_post)
+    bpy.app.handlers.redo_post.append(ModPOPM.lod_undo_post)
+    bpy.app.handlers.frame_change_pre.append(ModPOPM.live_frame_change)
+    bpy.app.handlers.load_pre.append(ModPOPM.runtime_clear)
+    bpy.app.handlers.save_pre.append(ModPOPM.gen_store_all)
 
 
 def unregister():
     from bpy.utils import unregister_class
 
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if ModPOPM.lod_undo_post in handlers:
+            handlers.remove(ModPOPM.lod_undo_post)
+    if ModPOPM.live_frame_change in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.remove(ModPOPM.live_frame_change)
+    if ModPOPM.runtime_clear in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(ModPOPM.runtime_clear)
+    if ModPOPM.gen_store_all in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(ModPOPM.gen_store_all)
+    ModPOPM.runtime_clear()
+    for timer in (ModPOPM.lod_commit, ModPOPM.pop_async_apply):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
     for cls in reversed(classes):
         unregister_class(cls)
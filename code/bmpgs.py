@@ -24,8 +24,10 @@
 
 
 import bpy
+import numpy as np
 
 from . import mpopm as ModPOPM
+from . import mcach as ModCACH
 from . import mpdop as ModPDOP
 
 
@@ -37,6 +39,12 @@ from . import mpdop as ModPDOP
 # ---- BMPGS PROPERTIES
 
 
+def anim_live_update(self, context):
+    pool = context.scene.ptdblnpopm_pool
+    if pool.update_ok:
+        ModPOPM.live_invalidate(context.scene)
+
+
 class PTDBLNPOPM_vec3(bpy.types.PropertyGroup):
     vert: bpy.props.FloatVectorProperty(
         size=3, default=(0, 0, 0), subtype="TRANSLATION"
@@ -45,53 +53,95 @@ class PTDBLNPOPM_vec3(bpy.types.PropertyGroup):
 
 class PTDBLNPOPM_anim_index(bpy.types.PropertyGroup):
     active: bpy.props.BoolProperty(
-        name="index", description="animate index", default=False, options={"HIDDEN"}
+        name="index",
+        description="animate index",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     offrnd: bpy.props.BoolProperty(
         name="random",
         description="random index value in [idx-offset, idx+offset]",
         default=False,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     offrndseed: bpy.props.IntProperty(
-        name="seed", description="random seed", default=0, min=0, options={"HIDDEN"}
+        name="seed",
+        description="random seed",
+        default=0,
+        min=0,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     offset: bpy.props.IntProperty(
         name="offset",
         description="index offset",
         default=0,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     beg: bpy.props.IntProperty(
-        name="start", description="start keyframe", default=1, min=1, options={"HIDDEN"}
+        name="start",
+        description="start keyframe",
+        default=1,
+        min=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     stp: bpy.props.IntProperty(
-        name="step", description="keyframe step", default=1, min=1, options={"HIDDEN"}
+        name="step",
+        description="keyframe step",
+        default=1,
+        min=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
 
 
 class PTDBLNPOPM_anim_mirror(bpy.types.PropertyGroup):
     active: bpy.props.BoolProperty(
-        name="mirror", description="target mirror", default=False, options={"HIDDEN"}
+        name="mirror",
+        description="target mirror",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     cycles: bpy.props.IntProperty(
-        name="repeat", description="mirror cycles", default=1, min=1, options={"HIDDEN"}
+        name="repeat",
+        description="mirror cycles",
+        default=1,
+        min=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
 
 
 class PTDBLNPOPM_anim_amount(bpy.types.PropertyGroup):
     active: bpy.props.BoolProperty(
-        name="factor", description="animate factor", default=False, options={"HIDDEN"}
+        name="factor",
+        description="animate factor",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     fac: bpy.props.FloatProperty(
-        name="target", description="factor", default=0, options={"HIDDEN"}
+        name="target",
+        description="factor",
+        default=0,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
 
 
 class PTDBLNPOPM_anim_rots(bpy.types.PropertyGroup):
     active: bpy.props.BoolProperty(
-        name="rotate", description="animate rotation", default=False, options={"HIDDEN"}
+        name="rotate",
+        description="animate rotation",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     fac: bpy.props.FloatProperty(
         name="angle",
@@ -100,13 +150,24 @@ class PTDBLNPOPM_anim_rots(bpy.types.PropertyGroup):
         min=-3.14,
         max=3.14,
         subtype="ANGLE",
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     beg: bpy.props.IntProperty(
-        name="start", description="from keyframe", default=1, min=1, options={"HIDDEN"}
+        name="start",
+        description="from keyframe",
+        default=1,
+        min=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     end: bpy.props.IntProperty(
-        name="end", description="to keyframe", default=1, min=1, options={"HIDDEN"}
+        name="end",
+        description="to keyframe",
+        default=1,
+        min=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
 
 
@@ -714,31 +775,39 @@ class PTDBLNPOPM_path(bpy.types.PropertyGroup):
     )
     pathed: bpy.props.PointerProperty(type=PTDBLNPOPM_pathed)
     ani_dim: bpy.props.BoolProperty(
-        name="size", description="animate dimensions", default=False, options={"HIDDEN"}
+        name="size",
+        description="animate dimensions",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_dim_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_lin_dim: bpy.props.FloatProperty(
         name="target",
         description="length",
         default=8,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_wav_dim: bpy.props.FloatProperty(
         name="target",
         description="length",
         default=8,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_arc_dim: bpy.props.FloatProperty(
         name="target",
         description="chord",
         default=8,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_spi_dim: bpy.props.FloatProperty(
         name="target",
         description="diameter",
         default=8,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_dim_2d: bpy.props.FloatVectorProperty(
@@ -746,6 +815,7 @@ class PTDBLNPOPM_path(bpy.types.PropertyGroup):
         description="size",
         size=2,
         default=(8, 8),
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_dim_3d: bpy.props.FloatVectorProperty(
@@ -753,22 +823,39 @@ class PTDBLNPOPM_path(bpy.types.PropertyGroup):
         description="size",
         size=3,
         default=(8, 8, 8),
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_fac: bpy.props.BoolProperty(
-        name="factor", description="animate value", default=False, options={"HIDDEN"}
+        name="factor",
+        description="animate value",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_fac_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_fac2: bpy.props.BoolProperty(
-        name="factor2", description="animate value", default=False, options={"HIDDEN"}
+        name="factor2",
+        description="animate value",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_fac2_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_fac3: bpy.props.BoolProperty(
-        name="factor3", description="animate value", default=False, options={"HIDDEN"}
+        name="factor3",
+        description="animate value",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_fac3_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_fac4: bpy.props.BoolProperty(
-        name="factor4", description="animate value", default=False, options={"HIDDEN"}
+        name="factor4",
+        description="animate value",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_fac4_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_lin_exp: bpy.props.FloatProperty(
@@ -777,37 +864,78 @@ class PTDBLNPOPM_path(bpy.types.PropertyGroup):
         default=2,
         min=0.2,
         max=5,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_wav_amp: bpy.props.FloatProperty(
-        name="target", description="amplitude", default=0.5, options={"HIDDEN"}
+        name="target",
+        description="amplitude",
+        default=0.5,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_wav_frq: bpy.props.FloatProperty(
-        name="target", description="frequency", default=1, options={"HIDDEN"}
+        name="target",
+        description="frequency",
+        default=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_wav_pha: bpy.props.FloatProperty(
-        name="target", description="phase", default=0, options={"HIDDEN"}
+        name="target",
+        description="phase",
+        default=0,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_arc_fac: bpy.props.FloatProperty(
-        name="target", description="factor", default=4, options={"HIDDEN"}
+        name="target",
+        description="factor",
+        default=4,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_ellstep_val: bpy.props.FloatProperty(
-        name="target", description="factor", default=0, options={"HIDDEN"}
+        name="target",
+        description="factor",
+        default=0,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_hel_len: bpy.props.FloatProperty(
-        name="target", description="length", default=8, options={"HIDDEN"}
+        name="target",
+        description="length",
+        default=8,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_hel_fac: bpy.props.FloatProperty(
-        name="target", description="width factor", default=1, options={"HIDDEN"}
+        name="target",
+        description="width factor",
+        default=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_hel_stp: bpy.props.FloatProperty(
-        name="target", description="frequency", default=2, options={"HIDDEN"}
+        name="target",
+        description="frequency",
+        default=2,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_hel_pha: bpy.props.FloatProperty(
-        name="target", description="phase", default=0, options={"HIDDEN"}
+        name="target",
+        description="phase",
+        default=0,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_spi_revs: bpy.props.FloatProperty(
-        name="target", description="frequency", default=1, options={"HIDDEN"}
+        name="target",
+        description="frequency",
+        default=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
 
     def anim_state(self):
@@ -1135,25 +1263,32 @@ class PTDBLNPOPM_prof(bpy.types.PropertyGroup):
     )
     profed: bpy.props.PointerProperty(type=PTDBLNPOPM_profed)
     ani_dim: bpy.props.BoolProperty(
-        name="size", description="animate dimensions", default=False, options={"HIDDEN"}
+        name="size",
+        description="animate dimensions",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_dim_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_lin_dim: bpy.props.FloatProperty(
         name="target",
         description="length",
         default=2,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_wav_dim: bpy.props.FloatProperty(
         name="target",
         description="length",
         default=2,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_arc_dim: bpy.props.FloatProperty(
         name="target",
         description="chord",
         default=2,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_epc_dim: bpy.props.FloatVectorProperty(
@@ -1161,18 +1296,31 @@ class PTDBLNPOPM_prof(bpy.types.PropertyGroup):
         description="size",
         size=2,
         default=(2, 2),
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_fac: bpy.props.BoolProperty(
-        name="factor", description="animate value", default=False, options={"HIDDEN"}
+        name="factor",
+        description="animate value",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_fac_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_fac2: bpy.props.BoolProperty(
-        name="factor 2", description="animate value", default=False, options={"HIDDEN"}
+        name="factor 2",
+        description="animate value",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_fac2_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_fac3: bpy.props.BoolProperty(
-        name="factor 3", description="animate value", default=False, options={"HIDDEN"}
+        name="factor 3",
+        description="animate value",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_fac3_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
     ani_lin_exp: bpy.props.FloatProperty(
@@ -1181,22 +1329,43 @@ class PTDBLNPOPM_prof(bpy.types.PropertyGroup):
         default=2,
         min=0.2,
         max=5,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_wav_amp: bpy.props.FloatProperty(
-        name="target", description="amplitude", default=0.5, options={"HIDDEN"}
+        name="target",
+        description="amplitude",
+        default=0.5,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_wav_frq: bpy.props.FloatProperty(
-        name="target", description="frequency", default=1, options={"HIDDEN"}
+        name="target",
+        description="frequency",
+        default=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_wav_pha: bpy.props.FloatProperty(
-        name="target", description="phase", default=0, options={"HIDDEN"}
+        name="target",
+        description="phase",
+        default=0,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_arc_fac: bpy.props.FloatProperty(
-        name="target", description="factor", default=1, options={"HIDDEN"}
+        name="target",
+        description="factor",
+        default=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_ellstep_val: bpy.props.FloatProperty(
-        name="target", description="factor", default=0, options={"HIDDEN"}
+        name="target",
+        description="factor",
+        default=0,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
 
     def anim_state(self):
@@ -1262,7 +1431,11 @@ class PTDBLNPOPM_blnd(bpy.types.PropertyGroup):
     iprams: bpy.props.PointerProperty(type=PTDBLNPOPM_params)
     ani_nidx: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_index)
     ani_fac: bpy.props.BoolProperty(
-        name="factor", description="animate value", default=False, options={"HIDDEN"}
+        name="factor",
+        description="animate value",
+        default=False,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
     ani_fac_val: bpy.props.FloatProperty(
         name="target",
@@ -1270,6 +1443,7 @@ class PTDBLNPOPM_blnd(bpy.types.PropertyGroup):
         description="blend factor",
         min=-1,
         max=1,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_fac_mirror: bpy.props.PointerProperty(type=PTDBLNPOPM_anim_mirror)
@@ -1307,12 +1481,14 @@ class PTDBLNPOPM_noiz(bpy.types.PropertyGroup):
         name="noise",
         description="animate noise",
         default=False,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_seed: bpy.props.BoolProperty(
         name="clock seed",
         description="animated seed",
         default=False,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_blin: bpy.props.IntProperty(
@@ -1320,6 +1496,7 @@ class PTDBLNPOPM_noiz(bpy.types.PropertyGroup):
         description="number of keyframes to full effect",
         default=1,
         min=1,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_blout: bpy.props.IntProperty(
@@ -1327,10 +1504,16 @@ class PTDBLNPOPM_noiz(bpy.types.PropertyGroup):
         description="number of keyframes to no effect",
         default=1,
         min=1,
+        update=anim_live_update,
         options={"HIDDEN"},
     )
     ani_stp: bpy.props.IntProperty(
-        name="step", description="keyframe step", default=1, min=1, options={"HIDDEN"}
+        name="step",
+        description="keyframe step",
+        default=1,
+        min=1,
+        update=anim_live_update,
+        options={"HIDDEN"},
     )
 
     def anim_state(self):
@@ -1340,6 +1523,7 @@ class PTDBLNPOPM_noiz(bpy.types.PropertyGroup):
 class PTDBLNPOPM_track(bpy.types.PropertyGroup):
     name: bpy.props.StringProperty(default="Track")
     t_name: bpy.props.StringProperty(default="name")
+    a_name: bpy.props.StringProperty(default="")
     active: bpy.props.BoolProperty(default=True)
     ac_beg: bpy.props.IntProperty(default=1)
     ac_end: bpy.props.IntProperty(default=2)
@@ -1361,6 +1545,9 @@ class PTDBLNPOPM_track(bpy.types.PropertyGroup):
     st_ctrl: bpy.props.BoolProperty(default=False)
     st_fra: bpy.props.IntProperty(default=1)
 
+    def action_name(self):
+        return self.a_name or self.t_name
+
     def to_dct(self, exclude=set()):
         d = {}
         for key in self.__annotations__.keys():
@@ -1372,11 +1559,31 @@ class PTDBLNPOPM_track(bpy.types.PropertyGroup):
 
 class PTDBLNPOPM_rngs(bpy.types.PropertyGroup):
     def rngs_common_update(self, context):
+        pool = context.scene.ptdblnpopm_pool
+        if pool.update_ok:
+            bpy.ops.ptdblnpopm.facerange_update()
+
+    def rngs_mode_update(self, context):
         pool = context.scene.ptdblnpopm_pool
         if pool.update_ok:
             bpy.ops.ptdblnpopm.pop_simple_update()
 
     active: bpy.props.BoolProperty(default=False)
+    mode: bpy.props.EnumProperty(
+        name="mode",
+        description="range output",
+        items=(
+            ("DELETE", "delete", "keep only the range faces"),
+            (
+                "ATTRIBUTE",
+                "attribute",
+                "keep all faces, store the range in a boolean face attribute",
+            ),
+        ),
+        default="DELETE",
+        update=rngs_mode_update,
+        options={"HIDDEN"},
+    )
     invert: bpy.props.BoolProperty(
         name="invert",
         description="invert selections",
@@ -1461,13 +1668,27 @@ class PTDBLNPOPM_rngs(bpy.types.PropertyGroup):
         update=rngs_common_update,
         options={"HIDDEN"},
     )
-    _sindz = {"data": set()}
+
+    def runtime_key(self):
+        owner = self.id_data
+        if isinstance(owner, bpy.types.Object):
+            return ModCACH.runtime_key(None, owner)
+        return ModCACH.runtime_key(owner, owner.ptdblnpopm_pool.pop_mesh)
 
     def sindz_get(self):
-        return self._sindz["data"]
+        sindz = ModCACH.runtime.get(self.runtime_key(), "sindz")
+        if sindz is None:
+            # registry misses after load or undo: rebuild from the settings
+            sindz = ModPOPM.range_indices_restore(self.id_data.ptdblnpopm_pool)
+            self.sindz_set(sindz)
+        return sindz
 
     def sindz_set(self, value):
-        self._sindz["data"] = value
+        sindz = np.asarray(value, dtype=np.int64)
+        ModCACH.runtime.set(self.runtime_key(), "sindz", sindz)
+
+    def sindz_on(self):
+        return self.active and self.mode == "DELETE"
 
 
 class PTDBLNPOPM_meshrot(bpy.types.PropertyGroup):
@@ -1610,6 +1831,82 @@ class PTDBLNPOPM_pool(bpy.types.PropertyGroup):
         default=False,
         options={"HIDDEN"},
     )
+    cache_disk: bpy.props.BoolProperty(
+        name="disk cache",
+        description="reuse evaluated meshes stored on disk",
+        default=False,
+        options={"HIDDEN"},
+    )
+    cache_dir: bpy.props.StringProperty(
+        name="cache directory",
+        description="disk cache location (empty: system temporary directory)",
+        default="",
+        subtype="DIR_PATH",
+        options={"HIDDEN"},
+    )
+    cache_size: bpy.props.IntProperty(
+        name="size",
+        description="[MB] disk cache size limit",
+        default=1024,
+        min=16,
+        options={"HIDDEN"},
+    )
+    cache_frames: bpy.props.BoolProperty(
+        name="frames",
+        description="also cache baked animation frames",
+        default=False,
+        options={"HIDDEN"},
+    )
+    cache_mem: bpy.props.IntProperty(
+        name="memory",
+        description="[MB] in-session cache budget for recent meshes (0: disabled)",
+        default=256,
+        min=0,
+        options={"HIDDEN"},
+    )
+    preview: bpy.props.BoolProperty(
+        name="preview",
+        description="reduced resolution while values change in quick succession",
+        default=False,
+        options={"HIDDEN"},
+    )
+    preview_fac: bpy.props.FloatProperty(
+        name="resolution",
+        description="preview resolution factor",
+        default=0.25,
+        min=0.05,
+        max=1,
+        subtype="FACTOR",
+        options={"HIDDEN"},
+    )
+    preview_delay: bpy.props.FloatProperty(
+        name="delay",
+        description="[seconds] idle time before the full resolution rebuild",
+        default=0.4,
+        min=0.1,
+        max=5,
+        options={"HIDDEN"},
+    )
+    async_eval: bpy.props.BoolProperty(
+        name="background",
+        description="evaluate full resolution meshes in a background thread",
+        default=False,
+        options={"HIDDEN"},
+    )
+    chunked: bpy.props.BoolProperty(
+        name="chunked",
+        description="evaluate in ring blocks into presized buffers (high resolutions)",
+        default=False,
+        options={"HIDDEN"},
+    )
+    chunk_rings: bpy.props.IntProperty(
+        name="block",
+        description="rings per evaluation block",
+        default=64,
+        min=1,
+        options={"HIDDEN"},
+    )
+    gen_dirty: bpy.props.BoolProperty(default=False, options={"HIDDEN"})
 
     def pool_act_name_get(self):
         return self.get("act_name", "Action")
@@ -1651,6 +1948,21 @@ class PTDBLNPOPM_pool(bpy.types.PropertyGroup):
         min=2,
         options={"HIDDEN"},
     )
+    ani_kf_decim: bpy.props.BoolProperty(
+        name="decimate",
+        description="drop static curves and keys that interpolation can rebuild",
+        default=False,
+        options={"HIDDEN"},
+    )
+    ani_kf_tol: bpy.props.FloatProperty(
+        name="tolerance",
+        description="maximum deviation of a decimated curve at the dropped keys",
+        default=0.0001,
+        min=0,
+        precision=5,
+        step=0.001,
+        options={"HIDDEN"},
+    )
     act_name: bpy.props.StringProperty(
         name="name",
         description="action name",
@@ -1659,6 +1971,71 @@ class PTDBLNPOPM_pool(bpy.types.PropertyGroup):
         set=pool_act_name_set,
     )
 
+    def pool_uv_update(self, context):
+        if self.update_ok:
+            bpy.ops.ptdblnpopm.pop_simple_update()
+
+    uv_map: bpy.props.BoolProperty(
+        name="UV",
+        description="generate grid uv coordinates",
+        default=False,
+        update=pool_uv_update,
+        options={"HIDDEN"},
+    )
+    uv_arc: bpy.props.BoolProperty(
+        name="arc length",
+        description="uv spacing by arc length instead of point index",
+        default=False,
+        update=pool_uv_update,
+        options={"HIDDEN"},
+    )
+
+    def pool_normals_update(self, context):
+        if self.update_ok:
+            bpy.ops.ptdblnpopm.pop_simple_update()
+
+    normals: bpy.props.BoolProperty(
+        name="normals",
+        description="write smooth grid normals as custom split normals",
+        default=False,
+        update=pool_normals_update,
+        options={"HIDDEN"},
+    )
+
+    def pool_ani_live_update(self, context):
+        if self.update_ok:
+            bpy.ops.ptdblnpopm.pop_simple_update()
+
+    ani_live: bpy.props.BoolProperty(
+        name="Live",
+        description=(
+            "evaluate the animation on frame change instead of baking keyframes "
+            "(enabled tracks still override the live result)"
+        ),
+        default=False,
+        update=pool_ani_live_update,
+        options={"HIDDEN"},
+    )
+
+    def pool_ani_stored_update(self, context):
+        if self.update_ok:
+            bpy.ops.ptdblnpopm.pop_simple_update()
+
+    ani_stored: bpy.props.BoolProperty(
+        name="Stored",
+        description="play the stored frame file on frame change",
+        default=False,
+        update=pool_ani_stored_update,
+        options={"HIDDEN"},
+    )
+    ani_store: bpy.props.StringProperty(
+        name="frame store",
+        description="delta compressed frame file",
+        default="",
+        subtype="FILE_PATH",
+        options={"HIDDEN"},
+    )
+
     def pool_show_wire_update(self, context):
         if self.update_ok:
             bpy.ops.ptdblnpopm.display_options()
@@ -1711,6 +2088,17 @@ class PTDBLNPOPM_pool(bpy.types.PropertyGroup):
             "show_warn",
             "show_wire",
             "anicalc",
+            "cache_disk",
+            "cache_dir",
+            "cache_size",
+            "cache_frames",
+            "cache_mem",
+            "preview",
+            "preview_fac",
+            "preview_delay",
+            "async_eval",
+            "chunked",
+            "chunk_rings",
         }
         for key in self.__annotations__.keys():
             if key in exclude:
@@ -2159,6 +2547,7 @@ def register():
         type=PTDBLNPOPM_profed
     )
     bpy.types.Scene.ptdblnpopm_pool = bpy.props.PointerProperty(type=PTDBLNPOPM_pool)
+    bpy.types.Object.ptdblnpopm_pool = bpy.props.PointerProperty(type=PTDBLNPOPM_pool)
 
 
 def unregister():
@@ -2166,6 +2555,7 @@ def unregister():
 
     for cls in reversed(classes):
         unregister_class(cls)
+    del bpy.types.Object.ptdblnpopm_pool
     del bpy.types.Scene.ptdblnpopm_pool
     del bpy.types.Scene.ptdblnpopm_profed
     del bpy.types.Scene.ptdblnpopm_pathed
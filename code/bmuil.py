@@ -25,6 +25,9 @@
 
 import bpy
 
+from . import mpopm as ModPOPM
+from . import mcach as ModCACH
+
 
 # ------------------------------------------------------------------------------
 #
@@ -68,6 +71,10 @@ class PTDBLNPOPM_UL_trax(bpy.types.UIList):
         self.use_filter_show = False
         cust_icon = "REC" if item.active else "RADIOBUT_OFF"
         layout.prop(item, "name", text="", emboss=False, icon=cust_icon)
+        name = item.action_name()
+        users = sum(1 for t in data.trax if t.action_name() == name)
+        if users > 1:
+            layout.label(text=str(users), icon="LINKED")
 
 
 # ---- PANELS
@@ -247,9 +254,78 @@ class PTDBLNPOPM_PT_ui_setup(PTDBLNPOPM_PT_ui, bpy.types.Panel):
         row.enabled = mesh_ok and edpans_ok
         row.prop(pool, "show_wire", toggle=True)
         row = col.row(align=True)
+        row.enabled = mesh_ok and edpans_ok
+        row.prop(pool, "uv_map", toggle=True)
+        rc = row.column(align=True)
+        rc.enabled = pool.uv_map
+        rc.prop(pool, "uv_arc", toggle=True)
+        row = col.row(align=True)
+        row.enabled = mesh_ok and edpans_ok
+        row.prop(pool, "normals", toggle=True)
+        row = col.row(align=True)
+        row.enabled = mesh_ok and edpans_ok
+        row.operator("ptdblnpopm.lod_chain")
+        row = col.row(align=True)
         row.prop(pool, "show_warn", toggle=True)
 
 
+class PTDBLNPOPM_PT_ui_setup_cache(PTDBLNPOPM_PT_ui, bpy.types.Panel):
+    bl_label = "performance"
+    bl_parent_id = "PTDBLNPOPM_PT_ui_setup"
+
+    def draw(self, context):
+        pool = context.scene.ptdblnpopm_pool
+        layout = self.layout
+        box = layout.box()
+        c = box.column(align=True)
+        c.prop(pool, "async_eval", toggle=True)
+        c.prop(pool, "preview", toggle=True)
+        col = c.column(align=True)
+        col.enabled = pool.preview
+        col.prop(pool, "preview_fac")
+        col.prop(pool, "preview_delay")
+        c = box.column(align=True)
+        c.prop(pool, "chunked", toggle=True)
+        col = c.column(align=True)
+        col.enabled = pool.chunked
+        col.prop(pool, "chunk_rings")
+        box = layout.box()
+        c = box.column(align=True)
+        c.prop(pool, "cache_mem")
+        mbs = ModCACH.runtime.nbytes() / 2**20
+        c.label(text=f"runtime buffers: {mbs:.1f} MB")
+        c = box.column(align=True)
+        row = c.row(align=True)
+        col = row.column(align=True)
+        col.prop(pool, "cache_disk", toggle=True)
+        col = row.column(align=True)
+        col.enabled = pool.cache_disk
+        col.prop(pool, "cache_frames", toggle=True)
+        col = c.column(align=True)
+        col.enabled = pool.cache_disk
+        col.prop(pool, "cache_dir", text="")
+        col.prop(pool, "cache_size")
+
+
+class PTDBLNPOPM_PT_ui_setup_generators(PTDBLNPOPM_PT_ui, bpy.types.Panel):
+    bl_label = "generators"
+    bl_parent_id = "PTDBLNPOPM_PT_ui_setup"
+
+    def draw(self, context):
+        scene = context.scene
+        gens = ModPOPM.gen_objects(scene)
+        dirty = sum(1 for ob in gens if ob.ptdblnpopm_pool.gen_dirty)
+        layout = self.layout
+        box = layout.box()
+        c = box.column(align=True)
+        c.label(text=f"generators: {len(gens)}  dirty: {dirty}")
+        c.operator("ptdblnpopm.gen_adopt")
+        c.operator("ptdblnpopm.gen_assign")
+        row = c.row(align=True)
+        row.operator("ptdblnpopm.gen_update_all", text="Update Dirty").dirty_only = True
+        row.operator("ptdblnpopm.gen_update_all", text="Update All").dirty_only = False
+
+
 class PTDBLNPOPM_PT_ui_path(PTDBLNPOPM_PT_ui, bpy.types.Panel):
     bl_label = "Path"
 
@@ -838,6 +914,9 @@ class PTDBLNPOPM_PT_ui_noiz(PTDBLNPOPM_PT_ui, bpy.types.Panel):
         row.prop(noiz, "ani_blin", text="")
         row.prop(noiz, "ani_blout", text="")
         row.prop(noiz, "ani_stp", text="")
+        c = bcol.column(align=True)
+        c.enabled = noiz.active
+        c.operator("ptdblnpopm.pop_population")
 
 
 class PTDBLNPOPM_PT_ui_ranges(PTDBLNPOPM_PT_ui, bpy.types.Panel):
@@ -860,6 +939,9 @@ class PTDBLNPOPM_PT_ui_ranges(PTDBLNPOPM_PT_ui, bpy.types.Panel):
         col = row.column(align=True)
         col.enabled = range_on
         col.prop(rngs, "invert", toggle=True)
+        row = bcol.row(align=True)
+        row.enabled = range_on
+        row.prop(rngs, "mode", expand=True)
         col = bcol.column(align=True)
         col.enabled = range_on
         row = col.row(align=True)
@@ -949,7 +1031,18 @@ class PTDBLNPOPM_PT_ui_animode(PTDBLNPOPM_PT_ui, bpy.types.Panel):
         row.prop(pool, "ani_kf_step", text="")
         row.prop(pool, "ani_kf_loop", text="")
         row = c.row(align=True)
+        row.prop(pool, "ani_kf_decim", toggle=True)
+        rc = row.row(align=True)
+        rc.enabled = pool.ani_kf_decim
+        rc.prop(pool, "ani_kf_tol", text="")
+        row = c.row(align=True)
         row.operator("ptdblnpopm.anicycmirend")
+        row.operator("ptdblnpopm.anim_vat", text="VAT")
+        row = c.row(align=True)
+        row.operator("ptdblnpopm.anim_store", text="Store")
+        rc = row.row(align=True)
+        rc.enabled = bool(pool.ani_store)
+        rc.prop(pool, "ani_stored", toggle=True)
         trax = pool.trax
         traxidx = pool.trax_idx
         nla_on = animode_on and bool(trax)
@@ -959,8 +1052,17 @@ class PTDBLNPOPM_PT_ui_animode(PTDBLNPOPM_PT_ui, bpy.types.Panel):
         rc.enabled = animode_on
         rc.operator("ptdblnpopm.anim_action", text="Add")
         rc = row.column(align=True)
+        rc.enabled = animode_on
+        rc.prop(pool, "ani_live", toggle=True)
+        rc = row.column(align=True)
         rc.enabled = nla_on
         rc.operator("ptdblnpopm.track_copy", text="Copy")
+        rc = row.column(align=True)
+        rc.enabled = nla_on
+        rc.operator("ptdblnpopm.track_unshare")
+        rc = row.column(align=True)
+        rc.enabled = nla_on
+        rc.operator("ptdblnpopm.track_flatten")
         col = col.column(align=True)
         col.enabled = nla_on
         row = col.row(align=True)
@@ -1034,6 +1136,8 @@ classes = (
     PTDBLNPOPM_UL_blnd,
     PTDBLNPOPM_UL_trax,
     PTDBLNPOPM_PT_ui_setup,
+    PTDBLNPOPM_PT_ui_setup_cache,
+    PTDBLNPOPM_PT_ui_setup_generators,
     PTDBLNPOPM_PT_ui_path,
     PTDBLNPOPM_PT_ui_path_anim,
     PTDBLNPOPM_PT_ui_pathloc,
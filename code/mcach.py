@@ -0,0 +1,373 @@
+##############################################################################
+#                                                                            #
+#   PopMesh for Blender  --  Copyright (C) 2024  Pan Thistle                 #
+#                                                                            #
+#   This program is free software: you can redistribute it and/or modify     #
+#   it under the terms of the GNU General Public License as published by     #
+#   the Free Software Foundation, either version 3 of the License, or        #
+#   (at your option) any later version.                                      #
+#                                                                            #
+#   This program is distributed in the hope that it will be useful,          #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the            #
+#   GNU General Public License for more details.                             #
+#                                                                            #
+#   You should have received a copy of the GNU General Public License        #
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.   #
+#                                                                            #
+##############################################################################
+
+
+# ------------------------------------------------------------------------------
+#
+# ----------------------------- IMPORTS ----------------------------------------
+
+
+import os
+import json
+import bisect
+import shutil
+import zipfile
+import tempfile
+
+import numpy as np
+
+from collections import OrderedDict
+
+
+# ------------------------------------------------------------------------------
+#
+# ---------------------------- CACHE HELPERS -----------------------------------
+
+
+def addon_version():
+    fpath = os.path.join(os.path.dirname(__file__), "blender_manifest.toml")
+    try:
+        with open(fpath, mode="r") as f:
+            for line in f:
+                key, _, val = line.partition("=")
+                if key.strip() == "version":
+                    return val.strip().strip('"')
+    except OSError:
+        pass
+    return "0.0.0"
+
+
+def default_dir():
+    return os.path.join(tempfile.gettempdir(), "ptdblnpopm_cache")
+
+
+def dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+# ------------------------------------------------------------------------------
+#
+# ------------------------------ DISK CACHE ------------------------------------
+
+
+class DiskCache:
+    """content-addressed evaluation buffers (LRU by access time)"""
+
+    _meta = "meta.json"
+
+    def __init__(self, root, limit):
+        self.root = root
+        self.limit = limit
+
+    def _entry(self, key):
+        return os.path.join(self.root, key)
+
+    def get(self, key):
+        path = self._entry(key)
+        fpath = os.path.join(path, self._meta)
+        if not os.path.isfile(fpath):
+            return None
+        try:
+            with open(fpath, mode="r") as f:
+                meta = json.load(f)
+            arrays = {
+                name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+                for name in meta["arrays"]
+            }
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        return meta, arrays
+
+    def put(self, key, arrays, meta):
+        path = self._entry(key)
+        if os.path.isdir(path):
+            return
+        tmp = os.path.join(self.root, f".{key}.{os.getpid()}")
+        try:
+            os.makedirs(tmp, exist_ok=True)
+            for name, arr in arrays.items():
+                np.save(os.path.join(tmp, f"{name}.npy"), arr)
+            meta = dict(meta, arrays=list(arrays.keys()))
+            with open(os.path.join(tmp, self._meta), mode="w") as f:
+                json.dump(meta, f)
+            os.replace(tmp, path)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self.evict()
+
+    def evict(self):
+        try:
+            names = [n for n in os.listdir(self.root) if not n.startswith(".")]
+        except OSError:
+            return
+        entries = []
+        for name in names:
+            path = self._entry(name)
+            try:
+                entries.append((os.path.getmtime(path), dir_size(path), path))
+            except OSError:
+                pass
+        total = sum(e[1] for e in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.limit:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+
+# ------------------------------------------------------------------------------
+#
+# ----------------------------- MEMORY CACHE -----------------------------------
+
+
+def entry_nbytes(arrays):
+    return sum(arr.nbytes for arr in arrays.values())
+
+
+class MemCache:
+    """recent evaluation buffers in memory (LRU within a byte budget)"""
+
+    def __init__(self, limit=0):
+        self.limit = limit
+        self.nbytes = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        entry = self._items.get(key)
+        if entry is not None:
+            self._items.move_to_end(key)
+        return entry
+
+    def put(self, key, arrays, meta):
+        if key in self._items:
+            self._items.move_to_end(key)
+            return
+        size = entry_nbytes(arrays)
+        if size > self.limit:
+            return
+        self._items[key] = (meta, arrays)
+        self.nbytes += size
+        self.trim()
+
+    def trim(self):
+        while self._items and self.nbytes > self.limit:
+            _, (meta, arrays) = self._items.popitem(last=False)
+            self.nbytes -= entry_nbytes(arrays)
+
+    def clear(self):
+        self._items.clear()
+        self.nbytes = 0
+
+
+# ------------------------------------------------------------------------------
+#
+# ---------------------------- RUNTIME BUFFERS ---------------------------------
+
+
+def runtime_key(scene, ob):
+    return (scene.as_pointer() if scene else 0, ob.as_pointer() if ob else 0)
+
+
+def value_nbytes(val):
+    if isinstance(val, np.ndarray):
+        return val.nbytes
+    if isinstance(val, dict):
+        return sum(value_nbytes(v) for v in val.values())
+    if isinstance(val, (list, tuple)):
+        return sum(value_nbytes(v) for v in val)
+    return 0
+
+
+def value_release(val):
+    if isinstance(val, dict):
+        for v in val.values():
+            value_release(v)
+    elif hasattr(val, "close"):
+        val.close()
+
+
+class Registry:
+    """derived buffers per (scene, object) pointer pair"""
+
+    def __init__(self):
+        self._slots = {}
+
+    def __len__(self):
+        return len(self._slots)
+
+    def get(self, key, name, default=None):
+        return self._slots.get(key, {}).get(name, default)
+
+    def set(self, key, name, value):
+        slot = self._slots.setdefault(key, {})
+        old = slot.get(name)
+        if old is not None and old is not value:
+            value_release(old)
+        slot[name] = value
+
+    def invalidate(self, key, *names):
+        slot = self._slots.get(key)
+        if slot is None:
+            return
+        if not names:
+            names = tuple(slot.keys())
+        for name in names:
+            value_release(slot.pop(name, None))
+        if not slot:
+            del self._slots[key]
+
+    def drop(self, name):
+        for key in list(self._slots):
+            self.invalidate(key, name)
+
+    def prune(self, keys):
+        for key in [k for k in self._slots if k not in keys]:
+            value_release(self._slots.pop(key))
+
+    def clear(self):
+        for slot in self._slots.values():
+            value_release(slot)
+        self._slots.clear()
+
+    def nbytes(self, key=None):
+        if key is not None:
+            return value_nbytes(self._slots.get(key, {}))
+        return sum(value_nbytes(slot) for slot in self._slots.values())
+
+
+runtime = Registry()
+
+
+# ------------------------------------------------------------------------------
+#
+# ------------------------------ FRAME STORE -----------------------------------
+
+
+def quant_dtype(d):
+    peak = np.abs(d).max() if d.size else 0
+    if peak < 2**7:
+        return np.int8
+    if peak < 2**15:
+        return np.int16
+    return None
+
+
+class FrameWriter:
+    """quantized frame deltas with periodic full keyframes (npz)"""
+
+    def __init__(self, fpath, quant, interval):
+        self.fpath = fpath
+        self.quant = np.float32(quant)
+        self.interval = interval
+        self.keys = []
+        self.count = 0
+        self.recon = None
+        self.tmp = f"{fpath}.{os.getpid()}"
+        self._zip = zipfile.ZipFile(
+            self.tmp, mode="w", compression=zipfile.ZIP_DEFLATED
+        )
+
+    def _put(self, name, arr):
+        with self._zip.open(f"{name}.npy", mode="w", force_zip64=True) as f:
+            np.lib.format.write_array(f, arr, allow_pickle=False)
+
+    def add(self, locs):
+        locs = np.asarray(locs, dtype=np.float32)
+        i = self.count
+        dtype = None
+        if self.recon is not None and (i - self.keys[-1]) < self.interval:
+            d = np.rint((locs - self.recon) / self.quant)
+            dtype = quant_dtype(d)
+        if dtype is None:
+            self.recon = locs.copy()
+            self.keys.append(i)
+            self._put(f"k{i}", self.recon)
+        else:
+            d = d.astype(dtype)
+            dq = d.astype(np.float32)
+            dq *= self.quant
+            self.recon += dq
+            self._put(f"d{i}", d)
+        self.count += 1
+
+    def close(self, meta):
+        meta = dict(meta, quant=float(self.quant), frames=self.count, keys=self.keys)
+        try:
+            self._put("meta", np.array(json.dumps(meta)))
+            self._zip.close()
+            os.replace(self.tmp, self.fpath)
+        except OSError:
+            self.abort()
+            raise
+
+    def abort(self):
+        self._zip.close()
+        try:
+            os.remove(self.tmp)
+        except OSError:
+            pass
+
+
+class FrameReader:
+    """decodes stored frames into one reusable buffer (sequential steps are cheap)"""
+
+    def __init__(self, fpath):
+        self._npz = np.load(fpath, allow_pickle=False)
+        self.meta = json.loads(self._npz["meta"].item())
+        self.quant = np.float32(self.meta["quant"])
+        self.keys = self.meta["keys"]
+        self.frames = self.meta["frames"]
+        self.index = -1
+        self.buf = None
+        self._tmp = None
+
+    def frame(self, i):
+        i = min(max(0, i), self.frames - 1)
+        if i == self.index:
+            return self.buf
+        k = self.keys[bisect.bisect_right(self.keys, i) - 1]
+        if not (k <= self.index < i):
+            key = self._npz[f"k{k}"]
+            if self.buf is None:
+                self.buf = np.empty_like(key)
+                self._tmp = np.empty_like(key)
+            self.buf[...] = key
+            self.index = k
+        for j in range(self.index + 1, i + 1):
+            self._tmp[...] = self._npz[f"d{j}"]
+            self._tmp *= self.quant
+            self.buf += self._tmp
+        self.index = i
+        return self.buf
+
+    def close(self):
+        self._npz.close()
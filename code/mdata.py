@@ -24,6 +24,7 @@
 
 
 import math
+import numpy as np
 
 from mathutils import Quaternion, Vector
 
@@ -86,6 +87,13 @@ def falloff_lists(npts, dct):
     return i_lst[:npts], v_lst[:npts]
 
 
+def falloff_weights(npts, dct):
+    ids, vals = falloff_lists(npts, dct)
+    weights = np.zeros(npts)
+    np.add.at(weights, ids, vals)
+    return weights
+
+
 def path_attitude_rots(locs, dv, cyclic):
     if cyclic:
         l2 = locs[-1]
@@ -183,9 +191,7 @@ class PopEx:
     def _poplocs_get(self):
         return [[loc.copy() for loc in self._proflocs] for _ in range(self._rings)]
 
-    def prof_blend(self, dct):
-        if not dct["fac"]:
-            return
+    def _blend_locs(self, dct):
         provider = dct["provider"]
         dct[f"res_{provider[:3]}"] = self._rpts
         bln_prof = getattr(ModPATH, provider.capitalize())(dct)
@@ -195,6 +201,12 @@ class PopEx:
         if dct["rot_align"]:
             q = Quaternion(self._zax, dct["rot_align"])
             blocs = [q @ loc for loc in blocs]
+        return blocs
+
+    def prof_blend(self, dct):
+        if not dct["fac"]:
+            return
+        blocs = self._blend_locs(dct)
         if not self._poplocs:
             self._poplocs = self._poplocs_get()
         nids, nfvs = falloff_lists(self._rings, dct["nprams"])
@@ -322,6 +334,166 @@ class PopEx:
             return [self._meshrot @ (v - piv) + piv for v in self._poplocs]
         return self._poplocs
 
+    def locs_blocks(self, blnds, proflocs, block):
+        rings = self._rings
+        rpts = self._rpts
+        base = np.array(self._proflocs, dtype=np.float64)
+        deltas = []
+        for dct in blnds:
+            if not dct["fac"]:
+                continue
+            blocs = np.array(self._blend_locs(dct), dtype=np.float64)
+            wr = falloff_weights(rings, dct["nprams"]) * dct["fac"]
+            wp = falloff_weights(rpts, dct["iprams"])
+            deltas.append((wr, (blocs - base) * wp[:, None]))
+        for dct in proflocs:
+            val = sum(1 if i else 0 for i in dct["axis"]) * dct["fac"]
+            if not val:
+                continue
+            axis = np.array(dct["axis"], dtype=np.float64) * dct["fac"]
+            wr = falloff_weights(rings, dct["nprams"])
+            wp = falloff_weights(rpts, dct["iprams"])
+            if dct["abs_move"]:
+                deltas.append((wr, wp[:, None] * axis))
+                continue
+            nrm = np.linalg.norm(base, axis=1, keepdims=True)
+            dv = np.divide(base, nrm, out=np.zeros_like(base), where=nrm > 0)
+            dv *= axis * wp[:, None]
+            dv[:, 2] = 0
+            deltas.append((wr, dv))
+        pa_l, pa_r = self._path_locs_rots()
+        if self._profrots:
+            pa_r = [q @ s for q, s in zip(pa_r, self._profrots)]
+        mats = np.array([q.to_matrix() for q in pa_r], dtype=np.float64)
+        vecs = np.array(pa_l, dtype=np.float64)
+        if self._meshrot_active:
+            mrot = np.array(self._meshrot.to_matrix(), dtype=np.float64)
+            piv = np.array(self._meshpivot, dtype=np.float64)
+        for beg in range(0, rings, block):
+            end = min(beg + block, rings)
+            locs = np.repeat(base[None], end - beg, axis=0)
+            for wr, dv in deltas:
+                locs += wr[beg:end, None, None] * dv
+            locs = np.einsum("rij,rpj->rpi", mats[beg:end], locs)
+            locs += vecs[beg:end, None]
+            locs = locs.reshape(-1, 3)
+            if self._meshrot_active:
+                locs = (locs - piv) @ mrot.T + piv
+            yield beg * rpts, locs
+
+    def _arc_params(self, locs, closed):
+        locs = np.array(locs, dtype=np.float64)
+        segs = np.linalg.norm(np.diff(locs, axis=0), axis=1)
+        if closed:
+            segs = np.append(segs, np.linalg.norm(locs[0] - locs[-1]))
+        params = np.concatenate(([0.0], np.cumsum(segs)))
+        if params[-1] < self._eps:
+            return np.linspace(0, 1, len(params))
+        return params / params[-1]
+
+    def get_uv_buffers(self, arc, block):
+        rpts = self._rpts
+        pts = rpts + 1 if self._profclosed else rpts
+        lines = self._rings + 1 if self._pathclosed else self._rings
+        if arc:
+            u = self._arc_params(self._proflocs, self._profclosed)
+            v = self._arc_params(self._pedlocs or self._pathlocs, self._pathclosed)
+        else:
+            u = np.linspace(0, 1, pts)
+            v = np.linspace(0, 1, lines)
+        caps = self._endcaps and not self._pathclosed
+        quads = (lines - 1) * (pts - 1)
+        uvs = np.empty((4 * quads + (2 * rpts if caps else 0), 2), dtype=np.float32)
+        cells = np.arange(pts - 1)
+        for beg in range(0, lines - 1, block):
+            end = min(beg + block, lines - 1)
+            ids = (np.arange(beg, end)[:, None] * pts + cells).ravel()
+            ids = np.stack((ids, ids + 1, ids + pts + 1, ids + pts), 1).ravel()
+            blk = uvs[4 * beg * (pts - 1) : 4 * end * (pts - 1)]
+            blk[:, 0] = u[ids % pts]
+            blk[:, 1] = v[ids // pts]
+        if caps:
+            xy = np.array(self._proflocs, dtype=np.float64)[:, :2]
+            lo = xy.min(axis=0)
+            cap = (xy - lo) / np.maximum(xy.max(axis=0) - lo, self._eps)
+            uvs[4 * quads : 4 * quads + rpts] = cap[::-1]
+            uvs[4 * quads + rpts :] = cap
+        return uvs
+
+    def get_vertex_normals(self, verts):
+        grid = np.asarray(verts, dtype=np.float32).reshape(self._rings, self._rpts, 3)
+        if self._profclosed:
+            du = np.roll(grid, -1, axis=1) - np.roll(grid, 1, axis=1)
+        else:
+            du = np.gradient(grid, axis=1)
+        if self._pathclosed and (self._twistang % self._tau) < self._eps:
+            dv = np.roll(grid, -1, axis=0) - np.roll(grid, 1, axis=0)
+        else:
+            dv = np.gradient(grid, axis=0)
+        nrms = np.cross(du, dv).reshape(-1, 3)
+        lens = np.linalg.norm(nrms, axis=1, keepdims=True)
+        np.divide(nrms, lens, out=nrms, where=lens > 0)
+        return nrms
+
+    def get_loop_normals(self, verts, loops):
+        verts = np.asarray(verts, dtype=np.float32)
+        nrms = self.get_vertex_normals(verts)[loops]
+        if self._endcaps and not self._pathclosed:
+            rpts = self._rpts
+            for beg in (len(loops) - 2 * rpts, len(loops) - rpts):
+                pts = verts[loops[beg : beg + rpts]]
+                nrm = np.cross(pts, np.roll(pts, -1, axis=0)).sum(axis=0)
+                nrms[beg : beg + rpts] = nrm / max(np.linalg.norm(nrm), self._eps)
+        return nrms
+
+    def _closing_scan(self, follow_limit):
+        cfl = tuple(range(self._rpts))
+        limit = 0
+        da = self._twistang % self._tau
+        if follow_limit:
+            if da > self._eps:
+                dt = self._tau / self._rpts
+                for i in range(self._rpts):
+                    val = dt * i + self._eps
+                    if val > da:
+                        limit = i
+                        break
+                cfl = cfl[limit:] + cfl[:limit]
+        else:
+            if self._hpi <= da < 3 * self._hpi:
+                cfl = cfl[::-1]
+        return cfl, limit
+
+    def get_face_buffers(self, block):
+        rpts = self._rpts
+        cols = np.arange(rpts)
+        if self._profclosed:
+            cols = np.append(cols, 0)
+        pts = len(cols)
+        scan = (np.arange(self._rings)[:, None] * rpts + cols).ravel()
+        lines = self._rings
+        if self._pathclosed:
+            cfl, limit = self._closing_scan(self._follow_limit or self._profclosed)
+            if self._profclosed:
+                cfl += (limit,)
+            scan = np.concatenate((scan, cfl))
+            lines += 1
+        caps = self._endcaps and not self._pathclosed
+        quads = (lines - 1) * (pts - 1)
+        sizes = np.full(quads + (2 if caps else 0), 4, dtype=np.int32)
+        loops = np.empty(4 * quads + (2 * rpts if caps else 0), dtype=np.int32)
+        cells = np.arange(pts - 1)
+        for beg in range(0, lines - 1, block):
+            end = min(beg + block, lines - 1)
+            ids = (np.arange(beg, end)[:, None] * pts + cells).ravel()
+            quad = (scan[ids], scan[ids + 1], scan[ids + pts + 1], scan[ids + pts])
+            loops[4 * beg * (pts - 1) : 4 * end * (pts - 1)] = np.stack(quad, 1).ravel()
+        if caps:
+            sizes[-2:] = rpts
+            loops[4 * quads : 4 * quads + rpts] = cols[rpts - 1 :: -1]
+            loops[4 * quads + rpts :] = np.arange(self._items - rpts, self._items)
+        return loops, sizes
+
     def get_faces(self):
         prof_closed = self._profclosed
         follow_limit = self._follow_limit
@@ -333,21 +505,7 @@ class PopEx:
             scan = tuple(range(self._items))
             pts = self._rpts
         if self._pathclosed:
-            cfl = tuple(range(self._rpts))
-            limit = 0
-            da = self._twistang % self._tau
-            if follow_limit:
-                if da > self._eps:
-                    dt = self._tau / self._rpts
-                    for i in range(self._rpts):
-                        val = dt * i + self._eps
-                        if val > da:
-                            limit = i
-                            break
-                    cfl = cfl[limit:] + cfl[:limit]
-            else:
-                if self._hpi <= da < 3 * self._hpi:
-                    cfl = cfl[::-1]
+            cfl, limit = self._closing_scan(follow_limit)
             if prof_closed:
                 cfl += (limit,)
             scan += cfl
@@ -24,6 +24,9 @@
 
 
 import bpy
+import json
+import hashlib
+import numpy as np
 
 from random import seed, randint
 
@@ -62,6 +65,21 @@ file_excluded_attributes = {
     "show_warn",
     "show_wire",
     "anicalc",
+    "cache_disk",
+    "cache_dir",
+    "cache_size",
+    "cache_frames",
+    "cache_mem",
+    "preview",
+    "preview_fac",
+    "preview_delay",
+    "async_eval",
+    "ani_live",
+    "ani_stored",
+    "ani_store",
+    "gen_dirty",
+    "chunked",
+    "chunk_rings",
 }
 
 
@@ -83,6 +101,16 @@ def setts_to_json(pg):
     return d
 
 
+def setts_hash(pg, version):
+    data = json.dumps(setts_to_json(pg), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(f"{version}:{data}".encode()).hexdigest()
+
+
+def pool_copy(src, dst):
+    dst.props_unset()
+    json_to_setts(setts_to_json(src), dst)
+
+
 def json_to_setts(d, pg):
     for key in d.keys():
         if (key not in pg.__annotations__.keys()) or (key in file_excluded_attributes):
@@ -465,14 +493,187 @@ def aniact_fc_create(action, dp, di, fls, vls, kls, loop):
     fc.keyframe_points.add(count=loop)
     fc.keyframe_points.foreach_set("co", [i for fv in zip(fls, vls) for i in fv])
     fc.keyframe_points.foreach_set("interpolation", kls)
+    return fc
 
 
 def aniact_fc_create_bez(action, dp, di, fls, vls, kls, loop):
-    fc = action.fcurves.new(data_path=dp, index=di)
-    fc.keyframe_points.add(count=loop)
-    fc.keyframe_points.foreach_set("co", [i for fv in zip(fls, vls) for i in fv])
-    fc.keyframe_points.foreach_set("interpolation", kls)
+    fc = aniact_fc_create(action, dp, di, fls, vls, kls, loop)
     fc.update()
+    return fc
+
+
+def aniact_fc_handles(fc, kfs, kvs, kms):
+    # aligned handles a third of the way to each neighbor: the segment is the
+    # exact hermite cubic that aniact_decim_bezier checked against the bake
+    kfs = np.asarray(kfs, dtype=np.float64)
+    dl = np.diff(kfs, prepend=kfs[0])
+    dr = np.diff(kfs, append=kfs[-1])
+    dl[0] = dr[0]
+    dr[-1] = dl[-1]
+    cnt = len(kfs)
+    hl = np.column_stack((kfs - dl / 3, kvs - kms * dl / 3))
+    hr = np.column_stack((kfs + dr / 3, kvs + kms * dr / 3))
+    fc.keyframe_points.foreach_set("handle_left_type", [3] * cnt)
+    fc.keyframe_points.foreach_set("handle_right_type", [3] * cnt)
+    fc.keyframe_points.foreach_set("handle_left", hl.ravel())
+    fc.keyframe_points.foreach_set("handle_right", hr.ravel())
+    fc.update()
+
+
+def aniact_write(action, vals, fls, ki_type, keep=None):
+    fc_create = aniact_fc_create_bez if ki_type == 2 else aniact_fc_create
+    loop = len(fls)
+    kls = [ki_type] * loop
+    slopes = None
+    if keep is not None and ki_type == 2:
+        fc_create = aniact_fc_create
+        slopes = aniact_bez_key_slopes(vals, np.asarray(fls, dtype=np.float64))
+    for c in range(len(vals)):
+        dp = f"vertices[{c // 3}].co"
+        di = c % 3
+        if keep is None:
+            fc_create(action, dp, di, fls, vals[c].tolist(), kls, loop)
+            continue
+        ks = np.flatnonzero(keep[c])
+        if not len(ks):
+            continue
+        kfs = [fls[k] for k in ks]
+        kvs = vals[c, ks]
+        fc = fc_create(action, dp, di, kfs, kvs.tolist(), kls[: len(ks)], len(ks))
+        if slopes is not None:
+            aniact_fc_handles(fc, kfs, kvs, slopes[c, ks])
+
+
+def aniact_bez_key_slopes(vals, fls):
+    slopes = np.empty(vals.shape, dtype=np.float64)
+    slopes[:, 0] = (vals[:, 1] - vals[:, 0]) / (fls[1] - fls[0])
+    slopes[:, -1] = (vals[:, -1] - vals[:, -2]) / (fls[-1] - fls[-2])
+    slopes[:, 1:-1] = (vals[:, 2:] - vals[:, :-2]) / (fls[2:] - fls[:-2])
+    extreme = (vals[:, 1:-1] - vals[:, :-2]) * (vals[:, 2:] - vals[:, 1:-1]) <= 0
+    slopes[:, 1:-1][extreme] = 0
+    return slopes
+
+
+def aniact_hermite(v0, m0, v1, m1, h, s):
+    s2 = s * s
+    s3 = s2 * s
+    fit = (2 * s3 - 3 * s2 + 1) * v0 + (3 * s2 - 2 * s3) * v1
+    fit += ((s3 - 2 * s2 + s) * m0 + (s3 - s2) * m1) * h
+    return fit
+
+
+def aniact_decim_greedy(vals, fls, tol, ki_type):
+    ncrv, cnt = vals.shape
+    rows = np.arange(ncrv)
+    keep = np.zeros((ncrv, cnt), dtype=bool)
+    keep[:, 0] = keep[:, -1] = True
+    last = np.zeros(ncrv, dtype=np.int64)
+    lo = np.full(ncrv, -np.inf)
+    hi = np.full(ncrv, np.inf)
+    for i in range(1, cnt - 1):
+        v0 = vals[rows, last]
+        if ki_type == 0:
+            drop = np.abs(vals[:, i] - v0) <= tol
+        else:
+            f0 = fls[last]
+            df = fls[i] - f0
+            lo = np.maximum(lo, (vals[:, i] - tol - v0) / df)
+            hi = np.minimum(hi, (vals[:, i] + tol - v0) / df)
+            dv = (vals[:, i + 1] - v0) / (fls[i + 1] - f0)
+            drop = (lo <= dv) & (dv <= hi)
+            lo[~drop] = -np.inf
+            hi[~drop] = np.inf
+        keep[:, i] = ~drop
+        last = np.where(drop, last, i)
+    return keep
+
+
+def aniact_decim_bezier(vals, fls, tol):
+    # starts from every key and drops key i while the single hermite segment
+    # from the last kept key to i + 1 stays within tol on all skipped frames
+    ncrv, cnt = vals.shape
+    slopes = aniact_bez_key_slopes(vals, fls)
+    keep = np.ones((ncrv, cnt), dtype=bool)
+    last = np.zeros(ncrv, dtype=np.int64)
+    for i in range(1, cnt - 1):
+        drop = np.zeros(ncrv, dtype=bool)
+        order = np.argsort(last, kind="stable")
+        anchors, starts = np.unique(last[order], return_index=True)
+        for a, rows in zip(anchors, np.split(order, starts[1:])):
+            h = fls[i + 1] - fls[a]
+            fit = aniact_hermite(
+                vals[rows, a, None],
+                slopes[rows, a, None],
+                vals[rows, i + 1, None],
+                slopes[rows, i + 1, None],
+                h,
+                (fls[a + 1 : i + 1] - fls[a]) / h,
+            )
+            drop[rows] = (np.abs(fit - vals[rows, a + 1 : i + 1]) <= tol).all(axis=1)
+        keep[:, i] = ~drop
+        last[~drop] = i
+    return keep
+
+
+def aniact_decimate(vals, fls, ki_type, tol):
+    fls = np.asarray(fls, dtype=np.float64)
+    still = np.ptp(vals, axis=1) <= tol
+    if ki_type == 2:
+        keep = aniact_decim_bezier(vals, fls, tol)
+    else:
+        keep = aniact_decim_greedy(vals, fls, tol, ki_type)
+    keep[still, 1:] = False
+    return keep
+
+
+action_tag = "ptdblnpopm_owned"
+
+
+def aniact_new(name):
+    action = bpy.data.actions.new(name)
+    action[action_tag] = True
+    return action
+
+
+def aniact_copy(action):
+    action = action.copy()
+    action[action_tag] = True
+    return action
+
+
+def aniact_trash(trax):
+    trash = {}
+    for t in trax:
+        name = t.action_name()
+        trash[name] = trash.get(name, False) or not t.a_name
+    return trash
+
+
+def aniact_free(trash):
+    # untagged actions are only freed for legacy tracks baked without a_name
+    trash = [
+        a
+        for a in bpy.data.actions
+        if a.name in trash and not a.users and (trash[a.name] or a.get(action_tag))
+    ]
+    for action in trash:
+        bpy.data.actions.remove(action)
+    return len(trash)
+
+
+def aniact_trax_add(pool, action, k_beg, k_end):
+    trk = pool.trax.add()
+    trk.t_name = action.name
+    trk.a_name = action.name
+    trk.ac_beg = k_beg
+    trk.ac_end = k_end
+    trk.sa_beg = k_beg
+    trk.sa_end = k_end
+    trk.s_beg = k_beg
+    trk.s_end = k_end
+    idx = len(pool.trax) - 1
+    pool.trax.move(idx, 0)
+    pool.trax_idx = 0
 
 
 def aniact_nla_track_add(mesh_data, action):
@@ -25,6 +25,7 @@
 
 import math
 
+from functools import lru_cache
 from mathutils import Matrix, Quaternion, Vector
 
 
@@ -57,14 +58,19 @@ def itexpo_in_out(t, p, m):
     return (2 * t) ** p / 2 if t < 0.5 else 1 - ((2 - 2 * t) ** p / 2)
 
 
-def it_list(ease, dt, p, m, count):
+@lru_cache(maxsize=256)
+def it_table(ease, dt, p, m, count):
     if ease == "LINEAR":
-        return [itlinear(i * dt, m) for i in range(count)]
+        return tuple(itlinear(i * dt, m) for i in range(count))
     if ease == "OUT":
-        return [itexpo_out(i * dt, p, m) for i in range(count)]
+        return tuple(itexpo_out(i * dt, p, m) for i in range(count))
     if ease == "IN":
-        return [itexpo_in(i * dt, p, m) for i in range(count)]
-    return [itexpo_in_out(i * dt, p, m) for i in range(count)]
+        return tuple(itexpo_in(i * dt, p, m) for i in range(count))
+    return tuple(itexpo_in_out(i * dt, p, m) for i in range(count))
+
+
+def it_list(ease, dt, p, m, count):
+    return list(it_table(ease, dt, p, m, count))
 
 
 # ------------------------------------------------------------------------------
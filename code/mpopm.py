@@ -25,10 +25,21 @@
 
 import bpy
 import bmesh
+import hashlib
+import json
+import os
+import threading
+import time
+import numpy as np
 
-from random import seed, randint, uniform
+from bpy.app.handlers import persistent
+from mathutils import Vector
+from itertools import chain
+from types import SimpleNamespace
 
 from . import mdata as ModDATA
+from . import mcach as ModCACH
+from . import mfnop as ModFNOP
 
 
 # ------------------------------------------------------------------------------
@@ -75,20 +86,34 @@ def user_mesh_verts(me):
 # ------------------------- SCENE UPDATES --------------------------------------
 
 
-def noiz_locs(locs, axis, amp, ns):
+def locs_array(locs):
+    if isinstance(locs, np.ndarray):
+        return locs.astype(np.float64, copy=False)
+    npts = len(locs)
+    arr = np.fromiter(chain.from_iterable(locs), dtype=np.float64, count=3 * npts)
+    return arr.reshape(npts, 3)
+
+
+def noiz_field(npts, axis, ns, frames=0):
+    rng = np.random.default_rng(ns)
+    shape = (frames, npts, 3) if frames else (npts, 3)
+    field = rng.random(shape, dtype=np.float32)
+    field *= 2
+    field -= 1
+    field *= np.asarray(axis, dtype=np.float32)
+    return field
+
+
+def noiz_locs(locs, axis, amp, ns, field=None):
     val = sum(1 if i else 0 for i in axis) * amp
     if not val:
         return locs
-    seed(ns)
-    npts = len(locs)
-    for j, fac in enumerate(axis):
-        if fac:
-            for i in range(npts):
-                locs[i][j] += fac * uniform(-amp, amp)
-    return locs
+    if field is None:
+        field = noiz_field(len(locs), axis, ns)
+    return locs_array(locs) + field * amp
 
 
-def new_pop_instance(pool):
+def pop_clean_check(pool):
     path = pool.path
     path.clean = (path.provider != "custom") or (len(path.pathed.upv) > 2)
     if not path.clean:
@@ -97,7 +122,11 @@ def new_pop_instance(pool):
     prof.clean = (prof.provider != "custom") or (len(prof.profed.upv) > 2)
     if not prof.clean:
         raise Exception("user profile, not enough vertices!")
-    return ModDATA.PopEx(pool.to_dct(), path.to_dct(), prof.to_dct())
+
+
+def new_pop_instance(pool):
+    pop_clean_check(pool)
+    return ModDATA.PopEx(pool.to_dct(), pool.path.to_dct(), pool.prof.to_dct())
 
 
 def update_prof_dependents(pool, rpts):
@@ -133,25 +162,227 @@ def update_all_dependents(pool, rings, rpts):
         item.nprams.npts = rings
 
 
-def pop_update(pop, pool):
+def update_dependents(pool, setup, rings, rpts):
+    if setup == "all":
+        update_all_dependents(pool, rings, rpts)
+    elif setup == "path":
+        update_path_dependents(pool, rings)
+    elif setup == "prof":
+        update_prof_dependents(pool, rpts)
+
+
+# ---- SETTINGS SNAPSHOT
+
+
+class RngsSnapshot(SimpleNamespace):
+    """plain copy of the face-range settings"""
+
+    sindz = np.empty(0, dtype=np.int64)
+
+    def sindz_get(self):
+        return self.sindz
+
+    def sindz_set(self, sindz):
+        self.sindz = np.asarray(sindz, dtype=np.int64)
+
+
+rngs_clamped_attributes = (
+    "rbeg",
+    "ritm",
+    "rgap",
+    "rstp",
+    "pbeg",
+    "pitm",
+    "pgap",
+    "pstp",
+)
+
+
+def snapshot_value(val):
+    if val is None or isinstance(val, (bool, int, float, str)):
+        return val
+    if isinstance(val, Vector):
+        return val.copy()
+    if isinstance(val, dict):
+        return {key: snapshot_value(v) for key, v in val.items()}
+    return tuple(snapshot_value(v) for v in val)
+
+
+def dct_npts(dct):
+    provider = dct["provider"]
+    if provider == "custom":
+        return len(dct["upv"])
+    return dct[f"res_{provider[:3]}"]
+
+
+def pop_snapshot(pool, setup="none", fac=1):
+    pop_clean_check(pool)
+    path = pool.path
+    prof = pool.prof
+    path_dct = snapshot_value(path.to_dct())
+    prof_dct = snapshot_value(prof.to_dct())
+    if fac >= 1:
+        update_dependents(pool, setup, dct_npts(path_dct), dct_npts(prof_dct))
+    snap = {
+        "pool": pool.to_dct(),
+        "path": path_dct,
+        "prof": prof_dct,
+        "lod": None,
+        "flags": (path.pathed.closed, path.pathed.endcaps, prof.profed.closed),
+        "chunk": pool.chunk_rings if pool.chunked else 0,
+        "uv": pool.uv_arc if pool.uv_map else None,
+        "normals": pool.normals,
+    }
     pgi = pool.meshrot
     if pgi.active:
-        pop.mesh_rotate(pgi.axis, pgi.angle, pgi.pivot)
+        snap["meshrot"] = snapshot_value((pgi.axis, pgi.angle, pgi.pivot))
     pgi = pool.pathrot
     if pgi.active:
-        pop.path_rotate(pgi.axis, pgi.angle, pgi.pivot, pgi.piv_object, pgi.batt)
+        vals = (pgi.axis, pgi.angle, pgi.pivot, pgi.piv_object, pgi.batt)
+        snap["pathrot"] = snapshot_value(vals)
     pgi = pool.profrot
     if pgi.active:
-        pop.prof_rotate(pgi.roll)
-    for item in pool.pathloc:
-        if item.active:
-            pop.path_locations(item.to_dct())
-    for item in pool.blnd:
-        if item.active:
-            pop.prof_blend(item.to_dct())
-    for item in pool.profloc:
-        if item.active:
-            pop.prof_locations(item.to_dct())
+        snap["profrot"] = (pgi.roll,)
+    for key in ("pathloc", "blnd", "profloc"):
+        items = getattr(pool, key)
+        snap[key] = [snapshot_value(i.to_dct()) for i in items if i.active]
+    pgi = pool.noiz
+    if pgi.active:
+        snap["noiz"] = snapshot_value((pgi.vfac, pgi.ampli, pgi.nseed))
+    pgi = pool.rngs
+    if pgi.active:
+        keys = rngs_clamped_attributes + ("invert", "rndsel", "nseed", "mode")
+        snap["rngs"] = {key: getattr(pgi, key) for key in keys}
+    return lod_snapshot(snap, fac, pool) if fac < 1 else snap
+
+
+def pop_evaluate(snap):
+    pop = ModDATA.PopEx(snap["pool"], snap["path"], snap["prof"])
+    rings = pop.rings
+    rpts = pop.rpts
+    lod = snap["lod"]
+    if lod:
+        lod = ((lod[0], rings), (lod[1], rpts))
+        remap = lambda dct: lod_item(dct, lod)
+    else:
+        remap = lambda dct: dct
+    if "meshrot" in snap:
+        pop.mesh_rotate(*snap["meshrot"])
+    if "pathrot" in snap:
+        pop.path_rotate(*snap["pathrot"])
+    if "profrot" in snap:
+        pop.prof_rotate(*snap["profrot"])
+    for dct in snap["pathloc"]:
+        pop.path_locations(remap(dct))
+    loops = sizes = faces = None
+    if snap["chunk"]:
+        verts, loops, sizes = pop_evaluate_chunked(pop, snap)
+        nfaces = len(sizes)
+    else:
+        for dct in snap["blnd"]:
+            pop.prof_blend(remap(dct))
+        for dct in snap["profloc"]:
+            pop.prof_locations(remap(dct))
+        verts = pop.get_locs()
+        if "noiz" in snap:
+            verts = noiz_locs(verts, *snap["noiz"])
+        faces = pop.get_faces()
+        nfaces = len(faces)
+    lattrs = {}
+    if snap["uv"] is not None:
+        lattrs["uvs"] = pop.get_uv_buffers(snap["uv"], snap["chunk"] or rings + 1)
+    if snap["normals"]:
+        floops = loops if faces is None else res_buffers({"faces": faces})[0]
+        lattrs["normals"] = pop.get_loop_normals(verts, floops)
+    rngs = None
+    rmask = None
+    if "rngs" in snap:
+        rngs = RngsSnapshot(**snap["rngs"])
+        r_rings, r_rpts = range_counts(snap["flags"], rings, rpts)
+        if lod:
+            f_rings, f_rpts = range_counts(snap["flags"], lod[0][0], lod[1][0])
+            rngs = lod_rngs(rngs, (f_rings, r_rings), (f_rpts, r_rpts))
+        if rngs.mode == "ATTRIBUTE":
+            rmask = range_face_mask(rngs, r_rings, r_rpts, nfaces)
+        elif faces is None:
+            buffers = range_buffers_update(
+                rngs, r_rings, r_rpts, verts, loops, sizes, lattrs
+            )
+            verts, loops, sizes = buffers
+        else:
+            faces = range_indices_update(rngs, r_rings, r_rpts, faces, lattrs)
+    return {
+        "verts": verts,
+        "faces": faces,
+        "loops": loops,
+        "sizes": sizes,
+        "uvs": lattrs.get("uvs"),
+        "normals": lattrs.get("normals"),
+        "rings": rings,
+        "rpts": rpts,
+        "rngs": rngs,
+        "rmask": rmask,
+        "lod": lod is not None,
+    }
+
+
+def pop_evaluate_chunked(pop, snap):
+    block = snap["chunk"]
+    verts = np.empty((pop.rings * pop.rpts, 3), dtype=np.float32)
+    rng = None
+    if "noiz" in snap:
+        axis, amp, ns = snap["noiz"]
+        if sum(1 if i else 0 for i in axis) * amp:
+            rng = np.random.default_rng(ns)
+            axis = np.asarray(axis, dtype=np.float32)
+    for beg, locs in pop.locs_blocks(snap["blnd"], snap["profloc"], block):
+        if rng is not None:
+            field = rng.random(locs.shape, dtype=np.float32)
+            field *= 2
+            field -= 1
+            field *= axis
+            locs += field * amp
+        verts[beg : beg + len(locs)] = locs
+    loops, sizes = pop.get_face_buffers(block)
+    return verts, loops, sizes
+
+
+def res_buffers(res):
+    if res["faces"] is None:
+        return res["loops"], res["sizes"]
+    faces = res["faces"]
+    sizes = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+    loops = np.fromiter(chain.from_iterable(faces), dtype=np.int32)
+    return loops, sizes
+
+
+def res_write(me, res):
+    rmask = res["rmask"]
+    if res["faces"] is None:
+        mesh_write_buffers(me, res["verts"], res["loops"], res["sizes"])
+    else:
+        loose = res["rngs"] is not None and rmask is None
+        mesh_rebuild(me, res["verts"], res["faces"], loose)
+    if rmask is not None:
+        range_mask_write(me, rmask)
+    if res["uvs"] is not None:
+        uv_write(me, res["uvs"])
+    if res["normals"] is not None:
+        normals_write(me, res["normals"])
+
+
+def pop_apply(pool, res):
+    me = mesh_own(pool.pop_mesh)
+    rngs = res["rngs"]
+    if res["lod"]:
+        me[stale_tag] = True
+    else:
+        me.pop(stale_tag, None)
+        if rngs:
+            for key in rngs_clamped_attributes:
+                setattr(pool.rngs, key, getattr(rngs, key))
+            pool.rngs.sindz_set(rngs.sindz)
+    res_write(me, res)
 
 
 def mesh_rebuild(me, verts, faces, remove_loose_verts=False):
@@ -169,18 +400,77 @@ def mesh_rebuild(me, verts, faces, remove_loose_verts=False):
     bpy.data.meshes.remove(tmp_me)
 
 
+def mesh_buffers(me):
+    verts = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", verts)
+    loops = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", loops)
+    sizes = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("loop_total", sizes)
+    return verts.reshape(-1, 3), loops, sizes
+
+
+def mesh_write_buffers(me, verts, loops, sizes):
+    me.clear_geometry()
+    me.vertices.add(len(verts))
+    me.vertices.foreach_set("co", np.ravel(verts))
+    me.loops.add(len(loops))
+    me.polygons.add(len(sizes))
+    starts = np.zeros(len(sizes), dtype=np.int32)
+    np.cumsum(sizes[:-1], out=starts[1:])
+    me.polygons.foreach_set("loop_start", starts)
+    if bpy.app.version < (4, 0, 0):
+        me.polygons.foreach_set("loop_total", sizes)
+    me.polygons.foreach_set("vertices", loops)
+    me.update(calc_edges=True)
+
+
+shared_tag = "ptdblnpopm_digest"
+
+
+def mesh_digest(verts, loops, sizes, rmask=None):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(verts, dtype=np.float32).tobytes())
+    h.update(sizes.tobytes())
+    h.update(loops.tobytes())
+    if rmask is not None:
+        h.update(np.ascontiguousarray(rmask, dtype=bool).tobytes())
+    return h.hexdigest()
+
+
+def mesh_shared():
+    return {me[shared_tag]: me for me in bpy.data.meshes if shared_tag in me}
+
+
+def mesh_share(ob, digest, shared):
+    me = shared.get(digest)
+    if me is None:
+        return False
+    old = ob.data
+    if me != old:
+        ob.data = me
+        if not old.users:
+            bpy.data.meshes.remove(old)
+    return True
+
+
+def mesh_own(ob):
+    me = ob.data
+    if me.users > 1 and shared_tag in me:
+        ob.data = me = me.copy()
+    me.pop(shared_tag, None)
+    return me
+
+
 def rngids_calc(npts, k, itm, gap, reps):
-    ids = [i % npts for i in range(k, k + itm)]
     if (npts == itm) or (reps < 2):
-        return ids
-    iinc = gap + 1
-    for i in range(reps - 1):
-        k = ids[-1] + iinc
-        ids += [j % npts for j in range(k, k + itm)]
-    return ids[:npts]
+        reps = 1
+    starts = k + np.arange(reps) * (itm + gap)
+    ids = (starts[:, None] + np.arange(itm)) % npts
+    return ids.ravel()[:npts]
 
 
-def range_indices_update(rngs, rings, rpts, faces):
+def range_face_indices(rngs, rings, rpts, nfaces):
     rngs.rbeg = rngs.rbeg % rings
     rngs.ritm = min(rngs.ritm, rings)
     rngs.rgap = min(rngs.rgap, rings - rngs.ritm)
@@ -197,47 +487,1100 @@ def range_indices_update(rngs, rings, rpts, faces):
     hi += 0 if rpts % grp < rngs.pitm else 1
     rngs.pstp = min(rngs.pstp, hi)
     pids = rngids_calc(rpts, rngs.pbeg, rngs.pitm, rngs.pgap, rngs.pstp)
-    inds = [r * rpts + p for r in rids for p in pids]
-    nfaces = len(faces)
+    inds = (rids[:, None] * rpts + pids).ravel()
+    inds = inds[inds < nfaces]
     if rngs.invert:
-        inds_set = set(inds)
-        inds = [i for i in range(nfaces) if i not in inds_set]
-    if rngs.rndsel:
-        seed(rngs.nseed)
-        inds_len = len(inds)
-        rfi = [randint(0, inds_len - 1) for _ in range(inds_len)]
-        inds = [inds[i] for i in rfi]
-    inds_set = set(i for i in inds if i < nfaces)
-    faces = [faces[i] for i in inds_set]
-    rngs.sindz_set(set(i for f in faces for i in f))
+        mask = np.ones(nfaces, dtype=bool)
+        mask[inds] = False
+        inds = np.flatnonzero(mask)
+    if rngs.rndsel and len(inds):
+        rng = np.random.default_rng(rngs.nseed)
+        inds = inds[rng.integers(0, len(inds), size=len(inds))]
+    return np.unique(inds)
+
+
+def range_indices_update(rngs, rings, rpts, faces, lattrs):
+    inds = range_face_indices(rngs, rings, rpts, len(faces))
+    if lattrs:
+        sizes = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+        sel = loops_select(sizes, inds)
+        for key, vals in lattrs.items():
+            lattrs[key] = vals[sel]
+    faces = [faces[i] for i in inds]
+    sindz = np.fromiter(chain.from_iterable(faces), dtype=np.int64)
+    rngs.sindz_set(np.unique(sindz))
     return faces
 
 
-def pop_mesh_update(pool, verts, rings, rpts, faces):
-    ob = pool.pop_mesh
+range_attribute = "ptdblnpopm_range"
+
+
+def range_face_mask(rngs, rings, rpts, nfaces):
+    mask = np.zeros(nfaces, dtype=bool)
+    mask[range_face_indices(rngs, rings, rpts, nfaces)] = True
+    return mask
+
+
+def range_mask_write(me, mask):
+    attr = me.attributes.get(range_attribute)
+    if attr and (attr.domain != "FACE" or attr.data_type != "BOOLEAN"):
+        me.attributes.remove(attr)
+        attr = None
+    if attr is None:
+        attr = me.attributes.new(range_attribute, "BOOLEAN", "FACE")
+    attr.data.foreach_set("value", mask)
+    me.update()
+
+
+def loops_select(sizes, inds):
+    starts = np.zeros(len(sizes), dtype=np.int64)
+    np.cumsum(sizes[:-1], out=starts[1:])
+    sizes = sizes[inds]
+    offs = np.cumsum(sizes) - sizes
+    return np.repeat(starts[inds] - offs, sizes) + np.arange(sizes.sum())
+
+
+def range_buffers_update(rngs, rings, rpts, verts, loops, sizes, lattrs):
+    inds = range_face_indices(rngs, rings, rpts, len(sizes))
+    sel = loops_select(sizes, inds)
+    for key, vals in lattrs.items():
+        lattrs[key] = vals[sel]
+    loops = loops[sel]
+    used = np.unique(loops)
+    rngs.sindz_set(used.astype(np.int64))
+    loops = np.searchsorted(used, loops).astype(np.int32)
+    return verts[used], loops, sizes[inds]
+
+
+def range_indices_restore(pool):
+    pop = new_pop_instance(pool)
+    flags = (pool.path.pathed.closed, pool.path.pathed.endcaps, pool.prof.profed.closed)
+    rings, rpts = range_counts(flags, pop.rings, pop.rpts)
+    keys = rngs_clamped_attributes + ("invert", "rndsel", "nseed")
+    rngs = RngsSnapshot(**{key: getattr(pool.rngs, key) for key in keys})
+    loops, sizes = pop.get_face_buffers(pop.rings + 1)
+    sel = loops_select(sizes, range_face_indices(rngs, rings, rpts, len(sizes)))
+    return np.unique(loops[sel]).astype(np.int64)
+
+
+uv_layer = "UVMap"
+
+
+def uv_write(me, uvs):
+    layer = me.uv_layers.get(uv_layer) or me.uv_layers.new(name=uv_layer)
+    layer.data.foreach_set("uv", np.ravel(uvs))
+
+
+def normals_write(me, normals):
+    me.polygons.foreach_set("use_smooth", np.ones(len(me.polygons), dtype=bool))
+    if bpy.app.version < (4, 1, 0):
+        me.use_auto_smooth = True
+    me.normals_split_custom_set(np.reshape(normals, (-1, 3)))
+
+
+def normals_read(me):
+    if bpy.app.version < (4, 1, 0):
+        me.calc_normals_split()
+    normals = np.empty(len(me.loops) * 3, dtype=np.float32)
+    me.loops.foreach_get("normal", normals)
+    return normals
+
+
+def normals_refresh(me, pop=None, verts=None):
+    if pop is not None:
+        loops = np.empty(len(me.loops), dtype=np.int32)
+        me.loops.foreach_get("vertex_index", loops)
+        normals_write(me, pop.get_loop_normals(verts, loops))
+        return
+    nrms = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("normal", nrms)
+    me.normals_split_custom_set_from_vertices(nrms.reshape(-1, 3))
+
+
+def range_update(scene):
+    pool = scene.ptdblnpopm_pool
+    rngs = pool.rngs
+    me = mesh_own(pool.pop_mesh)
+    quick = rngs.active and rngs.mode == "ATTRIBUTE" and not me.get(stale_tag)
+    if not (quick and me.attributes.get(range_attribute)):
+        scene_update(scene)
+        return
+    path = pool.path.pathed
+    prof = pool.prof.profed
+    flags = (path.closed, path.endcaps, prof.closed)
+    rings, rpts = range_counts(flags, path.npts, prof.npts)
+    range_mask_write(me, range_face_mask(rngs, rings, rpts, len(me.polygons)))
+
+
+def range_counts(flags, rings, rpts):
+    path_closed, endcaps, prof_closed = flags
+    if not path_closed:
+        rings = rings + 1 if endcaps else rings - 1
+    rpts = rpts if prof_closed else rpts - 1
+    return rings, rpts
+
+
+def pop_disk_cache(pool):
+    if not pool.cache_disk:
+        return None
+    root = bpy.path.abspath(pool.cache_dir) if pool.cache_dir else ""
+    return ModCACH.DiskCache(root or ModCACH.default_dir(), pool.cache_size * 2**20)
+
+
+pop_memo = ModCACH.MemCache()
+
+
+def pop_mem_cache(pool):
+    pop_memo.limit = pool.cache_mem * 2**20
+    if not pop_memo.limit:
+        pop_memo.clear()
+        return None
+    pop_memo.trim()
+    return pop_memo
+
+
+def pop_cache_key(pool):
+    return ModFNOP.setts_hash(pool, ModCACH.addon_version())
+
+
+def pop_frames_key(pool):
+    return f"{pop_cache_key(pool)}-frames"
+
+
+def pop_cache_entry(pool, rings, rpts):
+    verts, loops, sizes = mesh_buffers(pool.pop_mesh.data)
+    arrays = {"verts": verts, "loops": loops, "sizes": sizes}
+    rngs = pool.rngs
+    if rngs.sindz_on():
+        arrays["sindz"] = rngs.sindz_get().astype(np.int32)
+    elif rngs.active:
+        rmask = np.zeros(len(sizes), dtype=bool)
+        attr = pool.pop_mesh.data.attributes[range_attribute]
+        attr.data.foreach_get("value", rmask)
+        arrays["rmask"] = rmask
+    layer = pool.pop_mesh.data.uv_layers.get(uv_layer)
+    if pool.uv_map and layer:
+        uvs = np.empty(len(loops) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uvs)
+        arrays["uvs"] = uvs
+    if pool.normals:
+        arrays["normals"] = normals_read(pool.pop_mesh.data)
+    meta = {"rings": rings, "rpts": rpts}
+    meta["rngs"] = {key: getattr(rngs, key) for key in rngs_clamped_attributes}
+    return arrays, meta
+
+
+def pop_cache_apply(pool, entry, setup):
+    meta, arrays = entry
+    pool.path.clean = True
+    pool.prof.clean = True
+    update_dependents(pool, setup, meta["rings"], meta["rpts"])
     rngs = pool.rngs
     if rngs.active:
-        if not pool.path.pathed.closed:
-            rings = rings + 1 if pool.path.pathed.endcaps else rings - 1
-        rpts = rpts if pool.prof.profed.closed else rpts - 1
-        faces = range_indices_update(rngs, rings, rpts, faces)
-    mesh_rebuild(ob.data, verts, faces, rngs.active)
+        for key, val in meta["rngs"].items():
+            setattr(rngs, key, val)
+    if "sindz" in arrays:
+        rngs.sindz_set(arrays["sindz"])
+    me = mesh_own(pool.pop_mesh)
+    mesh_write_buffers(me, arrays["verts"], arrays["loops"], arrays["sizes"])
+    if "rmask" in arrays:
+        range_mask_write(me, arrays["rmask"])
+    if "uvs" in arrays:
+        uv_write(me, arrays["uvs"])
+    if "normals" in arrays:
+        normals_write(me, arrays["normals"])
 
 
-def scene_update(scene, setup="none"):
+# ------------------------------------------------------------------------------
+#
+# ------------------------- PREVIEW RESOLUTION ---------------------------------
+
+
+stale_tag = "ptdblnpopm_stale"
+
+pop_preview = {"scene": "", "setup": "none", "time": 0.0}
+
+
+def lod_res(dct, fac, pg):
+    provider = dct["provider"]
+    if provider != "custom":
+        key = f"res_{provider[:3]}"
+        lo = pg.bl_rna.properties[key].hard_min
+        dct[key] = max(lo, round(dct[key] * fac))
+    return dct
+
+
+def lod_group(n, m, beg, itm, gap, reps):
+    itm = min(max(1, itm), n)
+    gap = min(max(0, gap), n - itm)
+    fac = m / n
+    beg = int((beg % n) * fac)
+    itm = min(max(1, round(itm * fac)), m)
+    gap = min(round(gap * fac), m - itm)
+    grp = itm + gap
+    hi = m // grp
+    hi += 0 if m % grp < itm else 1
+    return beg, itm, gap, min(max(1, reps), hi)
+
+
+def lod_params(dct, n, m):
+    vals = lod_group(n, m, dct["idx"], dct["itm"], dct["gap"], dct["reps"])
+    dct["idx"], dct["itm"], dct["gap"], dct["reps"] = vals
+    dct["repfstp"] = min(max(1, dct["repfstp"]), dct["reps"])
+    dct["npts"] = m
+    return dct
+
+
+def lod_item(dct, lod):
+    (n, m), (k, l) = lod
+    dct = dict(dct)
+    dct["nprams"] = lod_params(dict(dct["nprams"]), n, m)
+    if "iprams" in dct:
+        dct["iprams"] = lod_params(dict(dct["iprams"]), k, l)
+    if "idx" in dct:
+        dct["idx"] = int((dct["idx"] % k) * l / k)
+    return dct
+
+
+def lod_rngs(rngs, rlod, plod):
+    vals = (rngs.rbeg, rngs.ritm, rngs.rgap, rngs.rstp)
+    rngs.rbeg, rngs.ritm, rngs.rgap, rngs.rstp = lod_group(*rlod, *vals)
+    vals = (rngs.pbeg, rngs.pitm, rngs.pgap, rngs.pstp)
+    rngs.pbeg, rngs.pitm, rngs.pgap, rngs.pstp = lod_group(*plod, *vals)
+    return rngs
+
+
+def lod_snapshot(snap, fac, pool):
+    path_dct = snap["path"]
+    prof_dct = snap["prof"]
+    lod = (dct_npts(path_dct), dct_npts(prof_dct))
+    path_dct = lod_res(dict(path_dct), fac, pool.path)
+    prof_dct = lod_res(dict(prof_dct), fac, pool.prof)
+    return dict(snap, path=path_dct, prof=prof_dct, lod=lod, chunk=0)
+
+
+def lod_update(pool):
+    pop_worker.cancel()
+    pop_apply(pool, pop_evaluate(pop_snapshot(pool, fac=pool.preview_fac)))
+
+
+def lod_setup(setup, pending):
+    if pending in {"none", setup}:
+        return setup
+    return pending if setup == "none" else "all"
+
+
+def lod_schedule(scene, setup, delay):
+    if pop_preview["scene"] != scene.name:
+        pop_preview["setup"] = "none"
+    pop_preview["scene"] = scene.name
+    pop_preview["setup"] = lod_setup(setup, pop_preview["setup"])
+    if bpy.app.timers.is_registered(lod_commit):
+        bpy.app.timers.unregister(lod_commit)
+    bpy.app.timers.register(lod_commit, first_interval=delay)
+
+
+def lod_request(scene, setup):
+    pool = scene.ptdblnpopm_pool
+    if not pool.preview:
+        return False
+    pending = bpy.app.timers.is_registered(lod_commit)
+    elapsed = time.monotonic() - pop_preview["time"]
+    rapid = pop_preview["scene"] == scene.name and elapsed < pool.preview_delay
+    if not (pending or rapid):
+        pop_preview["scene"] = scene.name
+        return False
+    lod_schedule(scene, setup, pool.preview_delay)
+    return True
+
+
+def lod_commit():
+    scene = bpy.data.scenes.get(pop_preview["scene"])
+    setup = pop_preview["setup"]
+    pop_preview["setup"] = "none"
+    if not scene:
+        return None
     pool = scene.ptdblnpopm_pool
+    if not (pool.pop_mesh and pool.pop_mesh.type == "MESH"):
+        return None
+    pool.update_ok = False
+    try:
+        full_update(scene, setup)
+        playback_update(scene)
+    except Exception as my_err:
+        print(f"lod_commit: {my_err.args}")
+    pool.update_ok = True
+    pop_preview["time"] = 0.0
+    return None
+
+
+@persistent
+def lod_undo_post(*args):
+    scene = bpy.context.scene
+    ob = scene.ptdblnpopm_pool.pop_mesh
+    if ob and ob.type == "MESH" and ob.data.get(stale_tag):
+        lod_schedule(scene, "all", scene.ptdblnpopm_pool.preview_delay)
+
+
+# ------------------------------------------------------------------------------
+#
+# --------------------------- ANIMATION KEYS -----------------------------------
+
+
+def anim_lists(pool, loop):
+    path = pool.path
+    prof = pool.prof
+    meshrot = pool.meshrot
+    pathrot = pool.pathrot
+    profrot = pool.profrot
+    noiz = pool.noiz
+    d = dict.fromkeys(("path", "prof", "meshrot", "pathrot", "profrot", "noiz"))
+    d["loop"] = loop
+    if path.anim_state():
+        d["path"] = ModFNOP.aniact_path_edit_dict(path, loop)
+    if prof.anim_state():
+        d["prof"] = ModFNOP.aniact_prof_edit_dict(prof, loop)
+    if meshrot.active and meshrot.anim_state():
+        d["meshrot"] = ModFNOP.aniact_rotation_list(meshrot.ani_rot, loop)
+    if pathrot.active and pathrot.anim_state():
+        d["pathrot"] = ModFNOP.aniact_rotation_list(pathrot.ani_rot, loop)
+    if profrot.active and profrot.anim_state():
+        d["profrot"] = ModFNOP.aniact_rotation_list(profrot.ani_rot, loop)
+    d["pathloc"] = ModFNOP.aniact_edvals_dict(pool.pathloc, loop, twodim=False)
+    d["blnd"] = ModFNOP.aniact_blendvals_dict(pool.blnd, loop)
+    d["profloc"] = ModFNOP.aniact_edvals_dict(pool.profloc, loop, twodim=True)
+    if noiz.active:
+        nsd = None if (noiz.anim_state() and noiz.ani_seed) else noiz.nseed
+        d["noiz"] = {
+            "seed": nsd,
+            "ampli": ModFNOP.aniact_noiz_list(noiz, loop),
+            "vfac": tuple(noiz.vfac),
+        }
+    return d
+
+
+def anim_noiz_field(alst, nlocs):
+    noiz = alst["noiz"]
+    nsd = noiz["seed"]
+    frames = alst["loop"] if nsd is None else 0
+    noiz["field"] = noiz_field(nlocs, noiz["vfac"], nsd, frames=frames)
+
+
+def anim_pop_instance(pool):
     pop = new_pop_instance(pool)
-    rings = pop.rings
-    rpts = pop.rpts
-    if setup == "all":
-        update_all_dependents(pool, rings, rpts)
-    elif setup == "path":
-        update_path_dependents(pool, rings)
-    elif setup == "prof":
-        update_prof_dependents(pool, rpts)
-    pop_update(pop, pool)
-    verts = pop.get_locs()
-    if pool.noiz.active:
-        verts = noiz_locs(verts, pool.noiz.vfac, pool.noiz.ampli, pool.noiz.nseed)
-    faces = pop.get_faces()
-    pop_mesh_update(pool, verts, rings, rpts, faces)
+    pgi = pool.meshrot
+    if pgi.active:
+        pop.mesh_rotate(pgi.axis, pgi.angle, pgi.pivot)
+    pgi = pool.pathrot
+    if pgi.active:
+        pop.path_rotate(pgi.axis, pgi.angle, pgi.pivot, pgi.piv_object, pgi.batt)
+    pgi = pool.profrot
+    if pgi.active:
+        pop.prof_rotate(pgi.roll)
+    return pop
+
+
+def anim_key_locs(pop, alst, i):
+    pop.reset_edlocs()
+    if alst["path"]:
+        pop.path_anim_update(*(v[i] for v in alst["path"].values()))
+    if alst["prof"]:
+        pop.prof_anim_update(*(v[i] for v in alst["prof"].values()))
+    d = alst["pathloc"]
+    for dct, nids, ams in zip(d["dcts"], d["nids"], d["ams"]):
+        dct["nprams"]["idx"] = nids[i]
+        dct["fac"] = ams[i]
+        pop.path_locations(dct)
+    d = alst["blnd"]
+    for dct, nids, ams, ids in zip(d["dcts"], d["nids"], d["ams"], d["ids"]):
+        dct["nprams"]["idx"] = nids[i]
+        dct["fac"] = ams[i]
+        dct["iprams"]["idx"] = ids[i]
+        pop.prof_blend(dct)
+    d = alst["profloc"]
+    for dct, nids, ams, ids in zip(d["dcts"], d["nids"], d["ams"], d["ids"]):
+        dct["nprams"]["idx"] = nids[i]
+        dct["fac"] = ams[i]
+        dct["iprams"]["idx"] = ids[i]
+        pop.prof_locations(dct)
+    if alst["meshrot"]:
+        pop.meshrot_anim_angle(alst["meshrot"][i])
+    if alst["pathrot"]:
+        pop.pathrot_anim_angle(alst["pathrot"][i])
+    if alst["profrot"]:
+        pop.roll_anim_angle(alst["profrot"][i])
+    locs = pop.get_locs()
+    noiz = alst["noiz"]
+    if noiz:
+        field = noiz["field"]
+        locs = noiz_locs(
+            locs,
+            noiz["vfac"],
+            noiz["ampli"][i],
+            noiz["seed"],
+            field=(field[i] if field.ndim > 2 else field),
+        )
+    return locs
+
+
+def anim_frames(pool, normals=False):
+    loop = pool.ani_kf_loop
+    alst = anim_lists(pool, loop)
+    nlocs = pool.path.pathed.npts * pool.prof.profed.npts
+    sindz = pool.rngs.sindz_get() if pool.rngs.sindz_on() else None
+    if alst["noiz"]:
+        anim_noiz_field(alst, nlocs)
+    pop = anim_pop_instance(pool)
+    for i in range(loop):
+        locs = locs_array(anim_key_locs(pop, alst, i)).astype(np.float32)
+        nrms = pop.get_vertex_normals(locs) if normals else None
+        if sindz is not None:
+            locs = locs[sindz]
+            nrms = None if nrms is None else nrms[sindz]
+        yield (i, locs, nrms) if normals else (i, locs)
+
+
+def nla_flatten(scene):
+    # strip timing, blending and influence only exist in the evaluated depsgraph,
+    # so every frame of the span is set and read back (one evaluation per frame)
+    pool = scene.ptdblnpopm_pool
+    me = pool.pop_mesh.data
+    items = [t for t in pool.trax if t.active]
+    fls = list(range(min(t.s_beg for t in items), max(t.s_end for t in items) + 1))
+    kloc = np.empty((len(fls), len(me.vertices), 3), dtype=np.float32)
+    frame = scene.frame_current
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    try:
+        for i, f in enumerate(fls):
+            scene.frame_set(f)
+            me.evaluated_get(depsgraph).vertices.foreach_get("co", kloc[i].ravel())
+    finally:
+        scene.frame_set(frame)
+    return kloc, fls
+
+
+# ---- VAT EXPORT
+
+
+vat_uv_layer = "ptdblnpopm_vat"
+
+
+def vat_buffer(fpath, fmt, frames, verts):
+    if fmt == "NPY":
+        shape = (frames, verts, 3)
+        return np.lib.format.open_memmap(fpath, "w+", np.float32, shape)
+    shape = (frames, verts, 4)
+    buf = np.lib.format.open_memmap(f"{fpath}.tmp.npy", "w+", np.float32, shape)
+    buf[..., 3] = 1
+    return buf
+
+
+def vat_save(fpath, fmt, buf):
+    buf.flush()
+    if fmt == "NPY":
+        return
+    frames, verts = buf.shape[:2]
+    img = bpy.data.images.new(
+        "ptdblnpopm_vat", verts, frames, alpha=True, float_buffer=True
+    )
+    try:
+        img.pixels.foreach_set(buf.ravel())
+        img.filepath_raw = fpath
+        img.file_format = "OPEN_EXR"
+        img.save()
+    finally:
+        bpy.data.images.remove(img)
+
+
+def vat_uv_write(me, verts):
+    if len(me.vertices) != verts:
+        raise Exception("mesh/animation vertex count mismatch!")
+    vids = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", vids)
+    uvs = np.zeros((len(vids), 2), dtype=np.float32)
+    uvs[:, 0] = (vids + 0.5) / verts
+    layer = me.uv_layers.get(vat_uv_layer) or me.uv_layers.new(name=vat_uv_layer)
+    layer.data.foreach_set("uv", uvs.ravel())
+
+
+def anim_vat_export(pool, fpath, fmt, normals):
+    loop = pool.ani_kf_loop
+    rngs = pool.rngs
+    nact = pool.path.pathed.npts * pool.prof.profed.npts
+    if rngs.sindz_on():
+        nact = len(rngs.sindz_get())
+    vat_uv_write(mesh_own(pool.pop_mesh), nact)
+    stem = os.path.splitext(fpath)[0]
+    ext = ".npy" if fmt == "NPY" else ".exr"
+    files = {"positions": stem + ext}
+    if normals:
+        files["normals"] = f"{stem}_normals{ext}"
+    bufs = {key: vat_buffer(val, fmt, loop, nact) for key, val in files.items()}
+    temps = [] if fmt == "NPY" else [buf.filename for buf in bufs.values()]
+    lo = np.full(3, np.inf)
+    hi = np.full(3, -np.inf)
+    try:
+        for i, locs, *nrms in anim_frames(pool, normals):
+            bufs["positions"][i, :, :3] = locs
+            if normals:
+                bufs["normals"][i, :, :3] = nrms[0]
+            lo = np.minimum(lo, locs.min(axis=0))
+            hi = np.maximum(hi, locs.max(axis=0))
+        for key in files:
+            vat_save(files[key], fmt, bufs[key])
+    finally:
+        bufs.clear()
+        for tmp in temps:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+    meta = {
+        "format": fmt,
+        "frames": loop,
+        "verts": nact,
+        "frame_start": pool.ani_kf_start,
+        "frame_step": pool.ani_kf_step,
+        "layout": "rows: frames (bottom up), columns: vertices, rgb: xyz",
+        "uv_layer": vat_uv_layer,
+        "bounds": {"min": lo.tolist(), "max": hi.tolist()},
+        "files": {key: os.path.basename(val) for key, val in files.items()},
+    }
+    with open(f"{stem}.json", mode="w") as f:
+        json.dump(meta, f, indent=2)
+
+
+# ---- FRAME STORE
+
+
+def anim_store_bake(pool, fpath, quant, interval):
+    ModCACH.runtime.drop("store")
+    writer = ModCACH.FrameWriter(fpath, quant, interval)
+    try:
+        verts = 0
+        for _, locs in anim_frames(pool):
+            writer.add(locs)
+            verts = len(locs)
+        meta = {
+            "verts": verts,
+            "frame_start": pool.ani_kf_start,
+            "frame_step": pool.ani_kf_step,
+            "key_type": pool.ani_kf_type,
+            "setts": pop_cache_key(pool),
+        }
+        writer.close(meta)
+    except Exception:
+        writer.abort()
+        raise
+
+
+def store_state(scene, fpath):
+    pool = scene.ptdblnpopm_pool
+    rkey = ModCACH.runtime_key(scene, pool.pop_mesh)
+    stamp = (fpath, os.path.getmtime(fpath))
+    state = ModCACH.runtime.get(rkey, "store")
+    if state and state["stamp"] == stamp:
+        return state
+    reader = ModCACH.FrameReader(fpath)
+    shape = (reader.meta["verts"], 3)
+    state = {"stamp": stamp, "reader": reader, "pair": -1}
+    for name in ("p", "a", "b", "n", "out"):
+        state[name] = np.empty(shape, dtype=np.float32)
+    ModCACH.runtime.set(rkey, "store", state)
+    return state
+
+
+def store_setts_key(scene):
+    pool = scene.ptdblnpopm_pool
+    rkey = ModCACH.runtime_key(scene, pool.pop_mesh)
+    key = ModCACH.runtime.get(rkey, "setts")
+    if key is None:
+        key = pop_cache_key(pool)
+        ModCACH.runtime.set(rkey, "setts", key)
+    return key
+
+
+def store_update(scene):
+    pool = scene.ptdblnpopm_pool
+    ob = pool.pop_mesh
+    if not (ob and ob.type == "MESH") or ob.data.get(stale_tag):
+        return
+    fpath = bpy.path.abspath(pool.ani_store)
+    if not os.path.isfile(fpath):
+        return
+    state = store_state(scene, fpath)
+    reader = state["reader"]
+    meta = reader.meta
+    if meta.get("setts") != store_setts_key(scene):
+        return
+    if len(ob.data.vertices) != meta["verts"]:
+        return
+    loop = reader.frames
+    t = scene.frame_current + scene.frame_subframe - meta["frame_start"]
+    t = min(max(0.0, t / meta["frame_step"]), loop - 1)
+    i = int(t)
+    bez = meta["key_type"] == "2"
+    if state["pair"] != i:
+        names = ("p", "a", "b", "n") if bez else ("a", "b")
+        beg = i - 1 if bez else i
+        for k, name in enumerate(names):
+            np.copyto(state[name], reader.frame(beg + k))
+        state["pair"] = i
+    verts = state["a"]
+    fac = t - i
+    if fac and bez:
+        m0 = 0 if i <= 0 else key_slope(state["p"], state["a"], state["b"])
+        m1 = key_slope(state["a"], state["b"], state["n"]) if i < loop - 2 else 0
+        verts = key_hermite(state["a"], state["b"], m0, m1, fac)
+    elif fac and meta["key_type"] != "0":
+        verts = state["out"]
+        np.subtract(state["b"], state["a"], out=verts)
+        verts *= fac
+        verts += state["a"]
+    me = mesh_own(ob)
+    me.vertices.foreach_set("co", verts.ravel())
+    me.update()
+    if pool.normals:
+        normals_refresh(me)
+
+
+# ---- LIVE MODE
+
+
+def live_state(scene):
+    pool = scene.ptdblnpopm_pool
+    rkey = ModCACH.runtime_key(scene, pool.pop_mesh)
+    kf = (pool.ani_kf_start, pool.ani_kf_step, pool.ani_kf_loop, pool.ani_kf_type)
+    state = ModCACH.runtime.get(rkey, "live")
+    if state and state["kf"] == kf:
+        return state
+    alst = anim_lists(pool, pool.ani_kf_loop)
+    if alst["noiz"]:
+        anim_noiz_field(alst, pool.path.pathed.npts * pool.prof.profed.npts)
+    sindz = None
+    if pool.rngs.sindz_on():
+        sindz = pool.rngs.sindz_get()
+    pop = anim_pop_instance(pool)
+    state = {"kf": kf, "alst": alst, "pop": pop, "sindz": sindz}
+    state["key"] = pop_cache_key(pool)
+    ModCACH.runtime.set(rkey, "live", state)
+    return state
+
+
+def live_key_verts(pool, state, i):
+    memo = pop_mem_cache(pool)
+    key = f"{state['key']}-live-{i}"
+    entry = memo.get(key) if memo is not None else None
+    if entry:
+        return entry[1]["verts"]
+    locs = anim_key_locs(state["pop"], state["alst"], i)
+    if isinstance(locs, np.ndarray):
+        verts = locs.astype(np.float32)
+    else:
+        verts = locs_array(locs).astype(np.float32)
+    if state["sindz"] is not None:
+        verts = verts[state["sindz"]]
+    if memo is not None:
+        memo.put(key, {"verts": verts}, {})
+    return verts
+
+
+def key_slope(prv, cur, nxt):
+    slope = (nxt - prv) * 0.5
+    slope[(nxt - cur) * (cur - prv) <= 0] = 0
+    return slope
+
+
+def key_hermite(a, b, m0, m1, fac):
+    # hermite segment with auto-clamped tangents (flat at ends and extremes)
+    f2 = fac * fac
+    f3 = f2 * fac
+    return a + (b - a) * (3 * f2 - 2 * f3) + m0 * (f3 - 2 * f2 + fac) + m1 * (f3 - f2)
+
+
+def live_key_slope(pool, state, i):
+    if i <= 0 or i >= pool.ani_kf_loop - 1:
+        return 0
+    prv = live_key_verts(pool, state, i - 1)
+    cur = live_key_verts(pool, state, i)
+    nxt = live_key_verts(pool, state, i + 1)
+    return key_slope(prv, cur, nxt)
+
+
+def live_bezier(pool, state, i, fac):
+    a = live_key_verts(pool, state, i)
+    b = live_key_verts(pool, state, i + 1)
+    m0 = live_key_slope(pool, state, i)
+    m1 = live_key_slope(pool, state, i + 1)
+    return key_hermite(a, b, m0, m1, fac)
+
+
+def live_update(scene):
+    pool = scene.ptdblnpopm_pool
+    ob = pool.pop_mesh
+    if not (ob and ob.type == "MESH") or ob.data.get(stale_tag):
+        return
+    if not pool.pop_anim_state_eval():
+        return
+    state = live_state(scene)
+    loop = pool.ani_kf_loop
+    t = scene.frame_current + scene.frame_subframe - pool.ani_kf_start
+    t = min(max(0.0, t / pool.ani_kf_step), loop - 1)
+    i = int(t)
+    verts = live_key_verts(pool, state, i)
+    fac = t - i
+    if fac and pool.ani_kf_type == "2":
+        verts = live_bezier(pool, state, i, fac)
+    elif fac and pool.ani_kf_type != "0":
+        nxt = live_key_verts(pool, state, i + 1)
+        verts = verts + (nxt - verts) * fac
+    me = mesh_own(ob)
+    if len(me.vertices) != len(verts):
+        return
+    me.vertices.foreach_set("co", np.ravel(verts))
+    me.update()
+    if pool.normals:
+        pop = state["pop"] if state["sindz"] is None else None
+        normals_refresh(me, pop, verts)
+
+
+def playback_update(scene):
+    pool = scene.ptdblnpopm_pool
+    if not pool.animorph:
+        return
+    if pool.ani_stored and pool.ani_store:
+        store_update(scene)
+    elif pool.ani_live:
+        live_update(scene)
+
+
+def live_invalidate(scene):
+    pool = scene.ptdblnpopm_pool
+    rkey = ModCACH.runtime_key(scene, pool.pop_mesh)
+    ModCACH.runtime.invalidate(rkey, "live", "setts")
+    live_frame_change(scene)
+
+
+@persistent
+def live_frame_change(scene, *args):
+    pool = scene.ptdblnpopm_pool
+    if not (pool.animorph and pool.update_ok):
+        return
+    try:
+        playback_update(scene)
+    except Exception as my_err:
+        print(f"live_frame_change: {my_err.args}")
+
+
+# ------------------------------------------------------------------------------
+#
+# ---------------------------- SCENE UPDATE ------------------------------------
+
+
+class PopWorker:
+    """single background evaluation thread (the newest request wins)"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._thread = None
+        self._job = None
+        self._done = None
+        self._busy = False
+        self.gen = 0
+
+    def pending(self):
+        with self._cond:
+            return self._busy or (self._job or self._done) is not None
+
+    def submit(self, job):
+        with self._cond:
+            self.gen += 1
+            job["gen"] = self.gen
+            self._job = job
+            self._done = None
+            self._cond.notify()
+        if not (self._thread and self._thread.is_alive()):
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def cancel(self):
+        with self._cond:
+            self.gen += 1
+            self._job = None
+            self._done = None
+
+    def take(self):
+        with self._cond:
+            job, self._done = self._done, None
+        return job
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._job is None:
+                    self._cond.wait()
+                job, self._job = self._job, None
+                self._busy = True
+            try:
+                job["res"] = pop_evaluate(job["snap"])
+            except Exception as my_err:
+                job["err"] = my_err.args
+            with self._cond:
+                self._busy = False
+                if job["gen"] == self.gen:
+                    self._done = job
+
+
+pop_worker = PopWorker()
+
+
+def pop_async_apply():
+    job = pop_worker.take()
+    if job:
+        scene = bpy.data.scenes.get(job["scene"])
+        pool = scene.ptdblnpopm_pool if scene else None
+        if "err" in job:
+            print(f"pop_async_apply: {job['err']}")
+        elif pool and pool.pop_mesh and pool.pop_mesh.type == "MESH":
+            pool.update_ok = False
+            try:
+                pop_apply(pool, job["res"])
+                pop_cache_store(pool, job["key"], job["res"])
+                playback_update(scene)
+            except Exception as my_err:
+                print(f"pop_async_apply: {my_err.args}")
+            pool.update_ok = True
+    return 0.02 if pop_worker.pending() else None
+
+
+def pop_async_submit(scene, snap, key):
+    pop_worker.submit({"scene": scene.name, "snap": snap, "key": key})
+    mesh_own(scene.ptdblnpopm_pool.pop_mesh)[stale_tag] = True
+    if not bpy.app.timers.is_registered(pop_async_apply):
+        bpy.app.timers.register(pop_async_apply, first_interval=0.02)
+
+
+def pop_cache_store(pool, key, res):
+    if key is None:
+        return
+    entry = pop_cache_entry(pool, res["rings"], res["rpts"])
+    memo = pop_mem_cache(pool)
+    if memo is not None:
+        memo.put(key, *entry)
+    dcache = pop_disk_cache(pool)
+    if dcache is not None:
+        dcache.put(key, *entry)
+
+
+def full_update(scene, setup):
+    pool = scene.ptdblnpopm_pool
+    pop_worker.cancel()
+    memo = pop_mem_cache(pool)
+    dcache = pop_disk_cache(pool)
+    snap = pop_snapshot(pool, setup)
+    key = None
+    if memo is not None or dcache is not None:
+        key = pop_cache_key(pool)
+        entry = memo.get(key) if memo is not None else None
+        if not entry and dcache is not None:
+            entry = dcache.get(key)
+            if entry and memo is not None:
+                meta, arrays = entry
+                memo.put(key, {k: np.array(v) for k, v in arrays.items()}, meta)
+        if entry:
+            pool.pop_mesh.data.pop(stale_tag, None)
+            pop_cache_apply(pool, entry, setup)
+            return
+    if pool.async_eval:
+        pop_async_submit(scene, snap, key)
+        return
+    res = pop_evaluate(snap)
+    pop_apply(pool, res)
+    pop_cache_store(pool, key, res)
+
+
+def runtime_prune():
+    keys = set()
+    for sc in bpy.data.scenes:
+        keys.add(ModCACH.runtime_key(sc, sc.ptdblnpopm_pool.pop_mesh))
+    for ob in bpy.data.objects:
+        if gen_owner(ob):
+            keys.add(ModCACH.runtime_key(None, ob))
+    ModCACH.runtime.prune(keys)
+
+
+# ---- POPULATION
+
+
+def pop_population(scene, count, seed, amp_range, spacing):
+    pool = scene.ptdblnpopm_pool
+    axis = tuple(pool.noiz.vfac)
+    if not any(axis):
+        raise Exception("population needs a non-zero noise axis!")
+    snap = pop_snapshot(pool)
+    snap.pop("noiz", None)
+    snap["normals"] = False
+    res = pop_evaluate(snap)
+    verts = locs_array(res["verts"])
+    loops, sizes = res_buffers(res)
+    base = bpy.data.meshes.new("pop_population")
+    res_write(base, res)
+    if pool.pop_mesh:
+        for mat in pool.pop_mesh.data.materials:
+            base.materials.append(mat)
+    if res["faces"] is not None and res["rngs"] is not None and res["rmask"] is None:
+        verts = verts[np.unique(loops)]
+    amp_seed, noiz_seed = np.random.SeedSequence(seed).spawn(2)
+    amps = np.random.default_rng(amp_seed).uniform(*amp_range, count)
+    field = noiz_field(len(verts), axis, noiz_seed, frames=count)
+    field *= amps.astype(np.float32)[:, None, None]
+    field += verts.astype(np.float32)
+    coll = bpy.data.collections.new("pop_population")
+    scene.collection.children.link(coll)
+    origin = pool.pop_mesh.location if pool.pop_mesh else Vector()
+    shared = mesh_shared()
+    for i in range(count):
+        digest = mesh_digest(field[i], loops, sizes, res["rmask"])
+        me = shared.get(digest)
+        if me is None:
+            me = base.copy()
+            me.name = f"pop_variant_{i:03d}"
+            me.vertices.foreach_set("co", field[i].ravel())
+            me.update()
+            me[shared_tag] = digest
+            shared[digest] = me
+        ob = bpy.data.objects.new(f"pop_variant_{i:03d}", me)
+        ob.location = origin + Vector(((i + 1) * spacing, 0, 0))
+        coll.objects.link(ob)
+    bpy.data.meshes.remove(base)
+    return coll
+
+
+# ---- LOD CHAIN
+
+
+def lod_chain(scene, levels, ratio):
+    pool = scene.ptdblnpopm_pool
+    src = pool.pop_mesh
+    coll = bpy.data.collections.get(f"{src.name}_LOD")
+    if coll is None:
+        coll = bpy.data.collections.new(f"{src.name}_LOD")
+        scene.collection.children.link(coll)
+    base = pop_snapshot(pool)
+    for k in range(levels):
+        snap = lod_snapshot(base, ratio**k, pool) if k else base
+        res = pop_evaluate(snap)
+        name = f"{src.name}_LOD{k}"
+        ob = bpy.data.objects.get(name)
+        if ob is None or ob.type != "MESH":
+            ob = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+            coll.objects.link(ob)
+        me = mesh_own(ob)
+        res_write(me, res)
+        me.materials.clear()
+        for mat in src.data.materials:
+            me.materials.append(mat)
+        ob.matrix_world = src.matrix_world.copy()
+    return coll
+
+
+# ---- OBJECT GENERATORS
+
+
+def gen_owner(ob):
+    return ob.type == "MESH" and ob.ptdblnpopm_pool.pop_mesh == ob
+
+
+def gen_objects(scene):
+    return [ob for ob in scene.objects if gen_owner(ob)]
+
+
+def gen_store(pool):
+    ob = pool.pop_mesh
+    if not (ob and ob.type == "MESH"):
+        return
+    gpool = ob.ptdblnpopm_pool
+    gpool.update_ok = False
+    ModFNOP.pool_copy(pool, gpool)
+    gpool.pop_mesh = ob
+    gpool.gen_dirty = False
+
+
+@persistent
+def gen_store_all(*args):
+    pools = [sc.ptdblnpopm_pool for sc in bpy.data.scenes]
+    states = [pool.update_ok for pool in pools]
+    for pool in pools:
+        pool.update_ok = False
+    try:
+        for pool in pools:
+            gen_store(pool)
+    finally:
+        for pool, state in zip(pools, states):
+            pool.update_ok = state
+
+
+def gen_adopt(scene, ob):
+    pool = scene.ptdblnpopm_pool
+    if pool.animorph:
+        raise Exception("leave animation mode first!")
+    if not gen_owner(ob):
+        raise Exception("not a popmesh generator!")
+    gen_store(pool)
+    pool.trax.clear()
+    pool.trax_idx = -1
+    ModFNOP.pool_copy(ob.ptdblnpopm_pool, pool)
+    pool.pop_mesh = ob
+    scene_update(scene, setup="all")
+
+
+def gen_assign(scene, obs):
+    pool = scene.ptdblnpopm_pool
+    gen_store(pool)
+    count = 0
+    for ob in obs:
+        if ob == pool.pop_mesh or not gen_owner(ob):
+            continue
+        gpool = ob.ptdblnpopm_pool
+        gpool.update_ok = False
+        ModFNOP.pool_copy(pool, gpool)
+        gpool.pop_mesh = ob
+        gpool.gen_dirty = True
+        count += 1
+    return count
+
+
+def gen_update_all(scene, dirty_only=True):
+    gen_store(scene.ptdblnpopm_pool)
+    pools = [ob.ptdblnpopm_pool for ob in gen_objects(scene)]
+    if dirty_only:
+        pools = [gpool for gpool in pools if gpool.gen_dirty]
+    shared = mesh_shared()
+    for gpool in pools:
+        res = pop_evaluate(pop_snapshot(gpool, setup="all"))
+        loops, sizes = res_buffers(res)
+        digest = mesh_digest(res["verts"], loops, sizes, res["rmask"])
+        if not mesh_share(gpool.pop_mesh, digest, shared):
+            pop_apply(gpool, res)
+            gpool.pop_mesh.data[shared_tag] = digest
+            shared[digest] = gpool.pop_mesh.data
+        gpool.gen_dirty = False
+    return len(pools)
+
+
+@persistent
+def runtime_clear(*args):
+    ModCACH.runtime.clear()
+
+
+def scene_update(scene, setup="none"):
+    pool = scene.ptdblnpopm_pool
+    runtime_prune()
+    rkey = ModCACH.runtime_key(scene, pool.pop_mesh)
+    ModCACH.runtime.invalidate(rkey, "live", "setts")
+    if lod_request(scene, setup):
+        lod_update(pool)
+    else:
+        full_update(scene, setup)
+        playback_update(scene)
+    pop_preview["time"] = time.monotonic()